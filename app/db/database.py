@@ -1,60 +1,138 @@
+import hashlib
 import logging
+import threading
 from contextlib import contextmanager
+from importlib import import_module
+from typing import Any, Dict, Tuple
 from fastapi import HTTPException
 from .redis_caches import get_connection_info
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of live connector instances, keyed by connection target.
+# Each entry holds (password_hash, connector) so a changed password forces a reconnect.
+_CONN_CACHE: Dict[Tuple, Tuple[str, Any]] = {}
+_CONN_LOCK = threading.Lock()
+
+def _lazy(module_name: str, class_name: str) -> type:
+    """Import a connector class from the dbDriver package"""
+    return getattr(import_module(f".dbDriver.{module_name}", __package__), class_name)
+
+# Connector loaders by database type; each driver is imported on first use only
+_LOADERS = {
+    "mysql": lambda: _lazy("mysqlConnector", "MySQLConnection"),
+    "postgresql": lambda: _lazy("postgreSqlConnector", "PostgreSQLConnection"),
+    "oracle": lambda: _lazy("oracleConnector", "OracleConnection"),
+    "sqlite": lambda: _lazy("sqliteConnector", "SQLiteConnection"),
+    "mongodb": lambda: _lazy("mongoDbConnector", "MongoDBConnection"),
+    "mssql": lambda: _lazy("mssqlConnector", "MSSQLConnection"),
+}
+
+# Connector classes already resolved in this process
+_RESOLVED: Dict[str, type] = {}
+
+def _get_db_class(db_type: str) -> type:
+    """Resolve the connector class for a database type (unknown types default to MSSQL)"""
+    if db_type not in _LOADERS:
+        db_type = "mssql"
+    return _RESOLVED.get(db_type) or _RESOLVED.setdefault(db_type, _LOADERS[db_type]())
+
+def _connection_key(db_type: str, connection_info: Dict[str, Any]) -> Tuple:
+    """Build the cache key for a connection (the password is not part of the key)"""
+    return (
+        db_type,
+        connection_info["server"],
+        connection_info["port"],
+        connection_info["database"],
+        connection_info["user"]
+    )
+
+def _password_hash(password: str) -> str:
+    """Hash a password so it can be compared without being kept in the key"""
+    return hashlib.sha256((password or "").encode()).hexdigest()
+
+def _is_alive(db_type: str, db: Any) -> bool:
+    """Cheap health check for a cached connection"""
+    try:
+        if db_type == "mongodb":
+            db.client.admin.command("ping")
+        else:
+            cursor = db.conn.cursor()
+            cursor.execute("SELECT 1 FROM DUAL" if db_type == "oracle" else "SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            # End the read transaction so the next request does not see a stale snapshot
+            db.conn.rollback()
+        return True
+    except Exception as e:
+        logger.warning(f"Cached {db_type} connection failed health check: {e}")
+        return False
+
+def _close_quietly(db: Any):
+    """Close a connector, ignoring errors from already-broken connections"""
+    try:
+        if hasattr(db, 'close'):
+            db.close()
+    except Exception as e:
+        logger.warning(f"Error closing cached database connection: {e}")
+
+def _open_connection(db_type: str, connection_info: Dict[str, Any]) -> Any:
+    """Create and connect a new connector instance for the given database type"""
+    db_class = _get_db_class(db_type)
+
+    # Create database connection
+    db = db_class()
+
+    conn = db.connect(
+        server=connection_info["server"],
+        database=connection_info["database"],
+        user=connection_info["user"],
+        password=connection_info["password"],
+        port=connection_info["port"]
+    )
+
+    if not conn:
+        raise HTTPException(status_code=500, detail="Failed to connect to database")
+
+    return db
+
 @contextmanager
 def get_db_connection(session_id: str):
-    """Get a database connection from session ID"""
+    """Get a database connection from session ID
+
+    Connections are cached per process and reused across requests; they are
+    not closed when the context exits (see close_all_connections).
+    """
     connection_info = get_connection_info(session_id)
-    
+
     if not connection_info:
         raise HTTPException(status_code=401, detail="Invalid or expired session")
-    
+
     db_type = connection_info.get("db_type", "mssql")
-    
-    # Import the appropriate connector based on database type
-    if db_type == "mysql":
-        from .dbDriver.mysqlConnector import MySQLConnection
-        db_class = MySQLConnection
-    elif db_type == "postgresql":
-        from .dbDriver.postgreSqlConnector import PostgreSQLConnection
-        db_class = PostgreSQLConnection
-    elif db_type == "oracle":
-        from .dbDriver.oracleConnector import OracleConnection
-        db_class = OracleConnection
-    elif db_type == "sqlite":
-        from .dbDriver.sqliteConnector import SQLiteConnection
-        db_class = SQLiteConnection
-    elif db_type == "mongodb":
-        from .dbDriver.mongodbConnector import MongoDBConnection
-        db_class = MongoDBConnection
-    else:
-        # Default to MSSQL
-        from .dbDriver.mssqlConnector import MSSQLConnection
-        db_class = MSSQLConnection
-    
-    # Create database connection
-    db = db_class()
-    
-    try:
-        # Connect to database
-        conn = db.connect(
-            server=connection_info["server"],
-            database=connection_info["database"],
-            user=connection_info["user"],
-            password=connection_info["password"],
-            port=connection_info["port"]
-        )
-        
-        if not conn:
-            raise HTTPException(status_code=500, detail="Failed to connect to database")
-        
-        yield db
-        
-    finally:
-        # Close connection
-        if hasattr(db, 'close'):
-            db.close()
\ No newline at end of file
+    key = _connection_key(db_type, connection_info)
+    password_hash = _password_hash(connection_info["password"])
+
+    with _CONN_LOCK:
+        cached = _CONN_CACHE.get(key)
+        if cached and cached[0] == password_hash and _is_alive(db_type, cached[1]):
+            db = cached[1]
+        else:
+            if cached:
+                _CONN_CACHE.pop(key, None)
+                _close_quietly(cached[1])
+            db = _open_connection(db_type, connection_info)
+            _CONN_CACHE[key] = (password_hash, db)
+
+    yield db
+
+def close_all_connections() -> int:
+    """Close and drop every cached database connection (called on shutdown)"""
+    with _CONN_LOCK:
+        entries = list(_CONN_CACHE.values())
+        _CONN_CACHE.clear()
+
+    for _, db in entries:
+        _close_quietly(db)
+
+    logger.info(f"Closed {len(entries)} cached database connection(s)")
+    return len(entries)
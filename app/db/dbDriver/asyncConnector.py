@@ -0,0 +1,112 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Worker threads shared by every facade of one driver, keyed by driver name
+_EXECUTORS: Dict[str, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+def _get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Get (or create) the worker pool for a driver; one thread per pooled connection"""
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(name)
+        if executor is None:
+            executor = _EXECUTORS[name] = ThreadPoolExecutor(max_workers=max_workers,
+                                                             thread_name_prefix=name.lower().replace(" ", ""))
+        return executor
+
+class AsyncConnector:
+    """Asyncio facade over a blocking connector that runs each call on a worker thread"""
+    def __init__(self, connector_cls: type, pool_size: int, name: str, methods: Iterable[str],
+                 **connector_kwargs):
+        self._connector_cls = connector_cls
+        self._connector_kwargs = connector_kwargs
+        self._pool_size = pool_size
+        self._name = name
+        # Connector methods exposed as coroutines
+        self._methods = frozenset(methods)
+        self._executor = _get_executor(name, pool_size)
+        self._params = None
+        # Connected connector instances not currently running a call
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Set by close(); read from worker threads to close connectors that finish afterwards
+        self._closed = False
+
+    def _open(self) -> Optional[Any]:
+        """Open a connector backed by a pooled connection"""
+        db = self._connector_cls(**self._connector_kwargs)
+        if db.connect(**self._params) is None:
+            return None
+        return db
+
+    def _call(self, method_name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Run a connector method on the current worker thread with a connector of its own"""
+        try:
+            db = self._idle.get_nowait()
+        except queue.Empty:
+            db = self._open()
+            if db is None:
+                raise ConnectionError(f"Failed to connect to {self._name}")
+        try:
+            return getattr(db, method_name)(*args, **kwargs)
+        finally:
+            # A call abandoned by a cancelled task can outlive close(); don't leave its connection idle
+            if self._closed:
+                db.close()
+            else:
+                self._idle.put(db)
+
+    async def _run(self, method_name: str, *args, **kwargs) -> Any:
+        """Await a connector method on the driver's executor"""
+        if self._slots is None or self._closed:
+            raise ConnectionError("No active connection")
+        # Each in-flight call holds its own pooled connection, so cap concurrency at the pool size
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(self._call, method_name, args, kwargs))
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Expose the listed connector methods as coroutines"""
+        # Only reached for attributes not set in __init__, so _methods is looked up normally
+        if name in self.__dict__.get("_methods", ()):
+            return partial(self._run, name)
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+    async def connect(self, server: str, database: str, user: str, password: str, port: Optional[int] = None) -> bool:
+        """Connect to the database (port defaults to the driver's)"""
+        self._params = {"server": server, "database": database, "user": user, "password": password}
+        if port is not None:
+            self._params["port"] = port
+        self._closed = False
+        self._slots = asyncio.Semaphore(self._pool_size)
+
+        loop = asyncio.get_running_loop()
+        db = await loop.run_in_executor(self._executor, self._open)
+        if db is None:
+            self._slots = None
+            return False
+
+        self._idle.put(db)
+        return True
+
+    async def close(self):
+        """Wait for in-flight calls, then return every connection to the connection pool"""
+        slots = self._slots
+        if slots is None:
+            return
+        # New calls are refused from here on; taking every slot waits out the running ones
+        self._closed = True
+        for _ in range(self._pool_size):
+            await slots.acquire()
+        self._slots = None
+
+        while True:
+            try:
+                db = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            db.close()
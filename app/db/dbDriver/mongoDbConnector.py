@@ -1,16 +1,127 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+import copy
+import functools
 import logging
-import math  # Add this import
-from typing import List, Dict, Any, Optional, Union
-from bson import ObjectId
+import os
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union
+import orjson
+from bson import Decimal128, ObjectId, json_util
+
+from ..redis_caches import (cache_collection_count, get_cached_collection_count,
+                            invalidate_collection_count)
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached collection-name set stays valid
+COLLECTIONS_CACHE_TTL = 30
+
+# Documents sampled, and sub-document levels walked, when listing a collection's fields
+COLUMN_SAMPLE_SIZE = 50
+COLUMN_KEY_DEPTH = 5
+
+def _to_oid(record_id: Any, _valid=ObjectId.is_valid, _OID=ObjectId) -> Any:
+    """Convert a string ID to an ObjectId when it is one, otherwise return it unchanged"""
+    # Pre-bound validity check avoids raising (and unwinding) for non-ObjectId keys
+    return _OID(record_id) if _valid(record_id) else record_id
+
+def _json_default(value: Any) -> Any:
+    """Encode BSON types that orjson does not handle natively"""
+    if isinstance(value, (ObjectId, Decimal128)):
+        return str(value)
+    # Binary/bytes, Timestamp, Regex, Code, DBRef, MinKey/MaxKey... as extended JSON (TypeError if unknown)
+    return json_util.default(value)
+
+def _key_paths_expr(pairs: Any, prefix: Any, depth: int) -> Dict[str, Any]:
+    """Build an aggregation expression listing the dotted key paths of $objectToArray pairs"""
+    # Variables are suffixed with the depth so nested $map/$let scopes never shadow each other
+    kv, path = f"kv{depth}", f"p{depth}"
+    value = f"$${kv}.v"
+    if depth > 1:
+        # Sub-documents, and documents inside arrays, contribute their pairs to the next level
+        children = {"$reduce": {
+            "input": {"$cond": [{"$eq": [{"$type": value}, "object"]}, [value],
+                                {"$cond": [{"$isArray": value}, value, []]}]},
+            "initialValue": [],
+            "in": {"$concatArrays": ["$$value", {"$cond": [{"$eq": [{"$type": "$$this"}, "object"]},
+                                                            {"$objectToArray": "$$this"}, []]}]}
+        }}
+        child_paths = _key_paths_expr(children, f"$${path}", depth - 1)
+    else:
+        child_paths = []
+    return {"$reduce": {
+        "input": {"$map": {"input": pairs, "as": kv, "in": {"$let": {
+            "vars": {path: {"$concat": [prefix, ".", f"$${kv}.k"]} if prefix else f"$${kv}.k"},
+            "in": {"$concatArrays": [[f"$${path}"], child_paths]}
+        }}}},
+        "initialValue": [],
+        "in": {"$concatArrays": ["$$value", "$$this"]}
+    }}
+
+def records_to_json(records: Any) -> bytes:
+    """Serialize documents straight to JSON bytes with orjson"""
+    return orjson.dumps(records, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+# Result returned by the paginated readers when no page could be fetched
+_EMPTY_PAGE = {"records": [], "total_count": 0, "total_pages": 0, "next_cursor": None}
+
+@lru_cache(maxsize=512)
+def _projection_for(columns: Tuple[str, ...]) -> Mapping[str, int]:
+    """Build (once per column set) a read-only projection that always includes _id"""
+    projection = {col: 1 for col in columns}
+    # Always include _id for proper identification
+    projection.setdefault('_id', 1)
+    # Shared between calls, so expose it read-only
+    return MappingProxyType(projection)
+
+def _mongo_op(default: Any = None, reraise: bool = False):
+    """Wrap a connector method with the shared connection check and error logging"""
+    # Callable defaults get the method's arguments; others are copied so callers can't mutate them
+    def fallback(self, args, kwargs):
+        return default(self, *args, **kwargs) if callable(default) else copy.deepcopy(default)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if self.db is None:
+                logger.error("No active connection")
+                return fallback(self, args, kwargs)
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                target = f" on collection {args[0]}" if args else ""
+                logger.error(f"Error in {fn.__name__}{target}: {e}")
+                # Write methods propagate failures to the router
+                if reraise:
+                    raise
+                return fallback(self, args, kwargs)
+        return wrapper
+    return decorator
+
+def _stringify_ids(documents) -> List[Dict[str, Any]]:
+    """Materialize documents, converting each document's ObjectId to a string in place"""
+    # Every MongoDB document carries _id, so no membership test is needed per document
+    records = []
+    _append = records.append
+    _str = str
+    for doc in documents:
+        doc['_id'] = _str(doc['_id'])
+        _append(doc)
+    return records
+
 class MongoDBConnection:
+    
     def __init__(self):
         self.client = None
         self.db = None
         self.db_name = None
+        # "server:port", so shared count caches don't mix databases of the same name on different servers
+        self._target = None
+        # (collection names, monotonic timestamp) used by _validate_table_exists
+        self._collections_cache = None
 
     def connect(self, server: str, database: str, user: str = None, password: str = None, port: int = 27017) -> Union[MongoClient, None]:
         """Connect to MongoDB database"""
@@ -21,13 +132,25 @@ class MongoDBConnection:
             else:
                 connection_string = f"mongodb://{server}:{port}/{database}"
             
-            # Connect to MongoDB
-            self.client = MongoClient(connection_string)
+            # Connect to MongoDB with wire compression and an explicitly sized pool;
+            # unsupported compressors are skipped during the handshake
+            self.client = MongoClient(
+                connection_string,
+                compressors="zstd,snappy,zlib",
+                maxPoolSize=int(os.getenv("MONGO_POOL_SIZE", "50")),
+                minPoolSize=5,
+                serverSelectionTimeoutMS=3000,
+                socketTimeoutMS=30000,
+                retryWrites=True,
+                readPreference="primaryPreferred",
+                appname="dbexplorer"
+            )
             self.db = self.client[database]
             self.db_name = database
+            self._target = f"{server}:{port}"
             
-            # Test the connection by listing collections
-            self.db.list_collection_names()
+            # Test the connection with a cheap ping (fails fast via serverSelectionTimeoutMS)
+            self.client.admin.command('ping')
             
             logger.info(f"Successfully connected to MongoDB database {database}")
             return self.client
@@ -35,177 +158,247 @@ class MongoDBConnection:
             logger.error(f"Error connecting to MongoDB: {e}")
             return None
 
+    @_mongo_op(default=[])
     def get_all_tables(self) -> List[Dict[str, str]]:
         """Get all collections (tables) in the database"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return []
-            
-            # In MongoDB, collections are equivalent to tables
-            collections = self.db.list_collection_names()
-            
-            # Return a list of dictionaries with database and collection names
-            tables = []
-            for collection in collections:
-                tables.append({
-                    'database': self.db_name,
-                    'table': collection
-                })
-            
-            logger.info(f"Found {len(tables)} collections")
-            return tables
-        except Exception as e:
-            logger.error(f"Error getting collections: {e}")
-            return []
+        # In MongoDB, collections are equivalent to tables
+        collections = self.db.list_collection_names()
+        self._collections_cache = (frozenset(collections), time.monotonic())
+        
+        # Return a list of dictionaries with database and collection names
+        tables = []
+        for collection in collections:
+            tables.append({
+                'database': self.db_name,
+                'table': collection
+            })
+        
+        logger.info(f"Found {len(tables)} collections")
+        return tables
     
+    @_mongo_op(default=0)
     def get_table_record_count(self, table_name: str) -> int:
         """Get the total number of documents in a specific collection"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return 0
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Count documents in the collection
-            count = self.db[table_name].count_documents({})
-            
-            logger.info(f"Found {count} documents in collection {table_name}")
-            return count
-        except Exception as e:
-            logger.error(f"Error getting document count for collection {table_name}: {e}")
-            return 0
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Count documents in the collection
+        count = self._count_documents(table_name)
+        
+        logger.info(f"Found {count} documents in collection {table_name}")
+        return count
     
+    @_mongo_op(default=None)
     def get_first_10_records(self, table_name: str) -> Optional[List[Dict[str, Any]]]:
         """Get the first 10 documents from a specific collection"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return None
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Get the first 10 documents from the collection
-            cursor = self.db[table_name].find({}).limit(10)
-            
-            # Convert MongoDB documents to dictionaries
-            records = []
-            for doc in cursor:
-                # Convert ObjectId to string
-                if '_id' in doc:
-                    doc['_id'] = str(doc['_id'])
-                records.append(doc)
-            
-            logger.info(f"Retrieved {len(records)} documents from collection {table_name}")
-            return records
-        except Exception as e:
-            logger.error(f"Error getting documents from collection {table_name}: {e}")
-            return None
-            
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Get the first 10 documents from the collection in a single batch
+        cursor = self.db[table_name].find({}).limit(10).batch_size(10)
+        
+        # Convert MongoDB documents to dictionaries
+        records = _stringify_ids(cursor)
+        
+        logger.info(f"Retrieved {len(records)} documents from collection {table_name}")
+        return records
+    
+    @_mongo_op(default=[])
     def get_table_columns(self, table_name: str) -> List[str]:
         """Get all fields (columns) for a specific collection"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return []
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # MongoDB doesn't have a fixed schema, so we need to analyze documents
-            # to determine all possible fields
-            
-            # Get a sample document
-            sample = self.db[table_name].find_one()
-            
-            if not sample:
-                return ['_id']  # Default field if collection is empty
-            
-            # Extract all keys from the sample document
-            columns = self._extract_all_keys(sample)
-            
-            logger.info(f"Found {len(columns)} fields in collection {table_name}")
-            return columns
-        except Exception as e:
-            logger.error(f"Error getting fields for collection {table_name}: {e}")
-            return []
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # MongoDB doesn't have a fixed schema, so we need to analyze documents
+        # to determine all possible fields
+        
+        # Sample documents and reduce them to their dotted key paths on the server (sub-documents
+        # and documents inside arrays included, COLUMN_KEY_DEPTH levels deep), so only one
+        # row per unique field name comes back and no values leave the server
+        pipeline = [
+            {"$sample": {"size": COLUMN_SAMPLE_SIZE}},
+            {"$project": {"_id": 0, "paths": _key_paths_expr({"$objectToArray": "$$ROOT"}, None, COLUMN_KEY_DEPTH)}},
+            {"$unwind": {"path": "$paths", "includeArrayIndex": "position"}},
+            {"$group": {"_id": "$paths", "position": {"$min": "$position"}}},
+            # Keep fields roughly in document order (_id first)
+            {"$sort": {"position": 1, "_id": 1}}
+        ]
+        columns = [field["_id"] for field in self.db[table_name].aggregate(pipeline)]
+        
+        if not columns:
+            return ['_id']  # Default field if collection is empty
+        
+        logger.info(f"Found {len(columns)} fields in collection {table_name}")
+        return columns
     
     def _extract_all_keys(self, document: Dict[str, Any], prefix: str = '') -> List[str]:
-        """Recursively extract all keys from a nested document"""
-        keys = []
-        for key, value in document.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            keys.append(full_key)
-            
-            # Handle nested documents
-            if isinstance(value, dict):
-                nested_keys = self._extract_all_keys(value, full_key)
-                keys.extend(nested_keys)
+        """Extract all dotted keys from a nested document, including documents inside arrays"""
+        # Dict used as an insertion-ordered set; the stack of item iterators keeps
+        # the original depth-first key order without recursion
+        keys = {}
+        stack = [(prefix, iter(document.items()))]
         
-        return keys
+        while stack:
+            current_prefix, items = stack[-1]
+            for key, value in items:
+                full_key = f"{current_prefix}.{key}" if current_prefix else key
+                keys[full_key] = None
+                
+                # Handle nested documents and arrays of documents
+                if isinstance(value, dict):
+                    children = [value]
+                elif isinstance(value, list):
+                    children = [item for item in value if isinstance(item, dict)]
+                else:
+                    continue
+                
+                if children:
+                    stack.extend((full_key, iter(child.items())) for child in reversed(children))
+                    break
+            else:
+                stack.pop()
+        
+        return list(keys)
+    
+    def _count_documents(self, table_name: str, query: Dict[str, Any] = None) -> int:
+        """Count documents, reading collection metadata (cached) when no filter is applied"""
+        if query:
+            return self.db[table_name].count_documents(query, hint="_id_")
+        
+        cached_count = get_cached_collection_count(self._target, self.db_name, table_name)
+        if cached_count is not None:
+            return cached_count
+        
+        count = self.db[table_name].estimated_document_count()
+        cache_collection_count(self._target, self.db_name, table_name, count)
+        return count
     
     def _get_primary_key_or_first_column(self, table_name: str) -> str:
         """Get the primary key field (always _id in MongoDB)"""
         return "_id"
     
-    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
-        """Get paginated documents from a specific collection, optionally with specific fields"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return {"records": [], "total_count": 0, "total_pages": 0}
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Get total count for pagination info
-            total_count = self.db[table_name].count_documents({})
-            
-            # Calculate pagination values
-            total_pages = math.ceil(total_count / page_size)
+    def _page_documents(self, table_name: str, page: int, page_size: int, columns: Optional[List[str]],
+                        after_id: Optional[str], include_total: Optional[bool]) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[int]]:
+        """Validate the collection and fetch one page of documents plus pagination totals"""
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+
+        # Counting is opt-in for cursor requests; page-number requests still need totals
+        if include_total is None:
+            include_total = after_id is None
+        
+        # Get total count for pagination info (count_documents is a full scan on big collections)
+        total_count = None
+        total_pages = None
+        if include_total:
+            total_count = self._count_documents(table_name)
+            total_pages = (total_count + page_size - 1) // page_size if total_count else 0
+        
+        # Prepare projection (fields to include)
+        projection = _projection_for(tuple(sorted(columns))) if columns else None
+        
+        # Range-based pagination on _id when a cursor token is supplied
+        if after_id:
+            cursor_id = _to_oid(after_id)
+            query = {"_id": {"$gt": cursor_id}}
+            skip = 0
+        else:
+            # Skip-based fallback for direct page jumps
+            query = {}
             skip = (page - 1) * page_size
             
-            # Prepare projection (fields to include)
-            projection = None
-            if columns:
-                projection = {col: 1 for col in columns}
-                # Always include _id for proper identification
-                if '_id' not in projection:
-                    projection['_id'] = 1
-            
-            # Get paginated documents
-            cursor = self.db[table_name].find({}, projection).skip(skip).limit(page_size)
-            
-            # Convert MongoDB documents to dictionaries
-            records = []
-            for doc in cursor:
-                # Convert ObjectId to string
-                if '_id' in doc:
-                    doc['_id'] = str(doc['_id'])
-                records.append(doc)
-            
-            logger.info(f"Retrieved {len(records)} documents from collection {table_name} (page {page}, page_size {page_size})")
-            
-            return {
-                "records": records,
-                "total_count": total_count,
-                "total_pages": total_pages
-            }
-        except Exception as e:
-            logger.error(f"Error getting paginated documents from collection {table_name}: {e}")
-            return {"records": [], "total_count": 0, "total_pages": 0}
+            # Pages past the end would only make the server skip to EOF to return nothing
+            if total_count is not None and skip >= total_count:
+                return [], total_count, total_pages
+        
+        documents = self._find_page(table_name, query, projection, skip, page_size)
+        return documents, total_count, total_pages
+    
+    def _find_page(self, table_name: str, query: Dict[str, Any], projection: Optional[Mapping[str, int]],
+                   skip: int, page_size: int) -> List[Dict[str, Any]]:
+        """Run a page query pinned to the _id index, retrying unhinted if the hint is rejected"""
+        def build_cursor():
+            # Sorting on _id is served by the index, so an in-memory/disk sort is never needed
+            # (allowDiskUse is left unset: servers before 4.4 reject the option on find)
+            cursor = self.db[table_name].find(query, projection).sort("_id", 1)
+            if skip:
+                cursor = cursor.skip(skip)
+            return cursor.limit(page_size).batch_size(page_size)
+        
+        try:
+            return list(build_cursor().hint("_id_"))
+        except OperationFailure as e:
+            logger.warning(f"_id_ index hint rejected for collection {table_name}, retrying without hint: {e}")
+            return list(build_cursor())
     
-    def _validate_table_exists(self, table_name: str) -> bool:
+    @_mongo_op(default=_EMPTY_PAGE)
+    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None,
+                              after_id: Optional[str] = None, include_total: Optional[bool] = None) -> Dict[str, Any]:
+        """Get paginated documents from a specific collection, optionally with specific fields"""
+        documents, total_count, total_pages = self._page_documents(table_name, page, page_size, columns,
+                                                             after_id, include_total)
+        
+        # Convert MongoDB documents to dictionaries
+        records = _stringify_ids(documents)
+        
+        next_cursor = records[-1]["_id"] if records else None
+        
+        logger.info(f"Retrieved {len(records)} documents from collection {table_name} (page {page}, page_size {page_size})")
+        
+        return {
+            "records": records,
+            "total_count": total_count,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
+        }
+    
+    @_mongo_op(default=None)
+    def get_paginated_records_raw(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None,
+                                  after_id: Optional[str] = None, include_total: Optional[bool] = None,
+                                  extra: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Get a page of documents already encoded as JSON bytes, ready to send as a response body"""
+        documents, total_count, total_pages = self._page_documents(table_name, page, page_size, columns,
+                                                             after_id, include_total)
+        
+        # ObjectIds are converted by the encoder, so documents are not rewritten here
+        records = documents
+        next_cursor = str(records[-1]["_id"]) if records else None
+        
+        logger.info(f"Retrieved {len(records)} raw documents from collection {table_name} (page {page}, page_size {page_size})")
+        
+        return records_to_json({
+            **(extra or {}),
+            "records": records,
+            "total_count": total_count,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
+        })
+    
+    def _validate_table_exists(self, table_name: str, fallback: bool = True) -> bool:
         """Validate that a collection exists"""
-        if not self.db:
+        if self.db is None:
             logger.error("No active connection")
             return False
             
-        collections = self.db.list_collection_names()
-        exists = table_name in collections
+        # Reuse the collection list for a short TTL instead of listing on every call
+        now = time.monotonic()
+        cache = self._collections_cache
+        if cache and now - cache[1] <= COLLECTIONS_CACHE_TTL and table_name in cache[0]:
+            return True
+        
+        # Cache miss: one _id index hit proves a non-empty collection exists
+        if self.db[table_name].find_one({}, {"_id": 1}) is not None:
+            names, cached_at = cache if cache else (frozenset(), now)
+            self._collections_cache = (names | {table_name}, cached_at)
+            return True
+        
+        # Callers whose operation simply matches nothing on a missing collection skip the listing
+        if not fallback:
+            return False
+        
+        # Empty collections only show up in the collection listing
+        self._collections_cache = (frozenset(self.db.list_collection_names()), now)
+        exists = table_name in self._collections_cache[0]
         
         if not exists:
             logger.error(f"Collection '{table_name}' not found")
@@ -218,173 +411,167 @@ class MongoDBConnection:
         # For MongoDB, we accept all fields since documents can have any fields
         return columns
     
+    @_mongo_op(default=False, reraise=True)
     def update_record(self, table_name: str, record_id: str, column_name: str, new_value: Any) -> bool:
         """Update a specific field in a document"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return False
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # MongoDB uses _id as the primary key
-            # Handle nested fields (fields with dots)
-            if '.' in column_name:
-                update_data = {column_name: new_value}
-            else:
-                update_data = {column_name: new_value}
-            
-            # Convert string ID to ObjectId if needed
-            try:
-                object_id = ObjectId(record_id)
-            except:
-                object_id = record_id
-            
-            result = self.db[table_name].update_one(
-                {"_id": object_id},
-                {"$set": update_data}
-            )
-            
-            # Check if any documents were modified
-            if result.modified_count == 0:
-                logger.warning(f"No documents updated in collection {table_name} with ID {record_id}")
-                return False
-            
-            logger.info(f"Successfully updated field {column_name} for document {record_id} in collection {table_name}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error updating document in collection {table_name}: {e}")
-            raise e
-
-    def get_table_records(self, table_name: str, page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
+        # Validate collection exists
+        self._validate_table_exists(table_name, fallback=False)
+        
+        # MongoDB uses _id as the primary key
+        # Handle nested fields (fields with dots)
+        if '.' in column_name:
+            update_data = {column_name: new_value}
+        else:
+            update_data = {column_name: new_value}
+        
+        # Convert string ID to ObjectId if needed
+        object_id = _to_oid(record_id)
+        
+        result = self.db[table_name].update_one(
+            {"_id": object_id},
+            {"$set": update_data}
+        )
+        
+        # Check if any documents were modified
+        if result.modified_count == 0:
+            logger.warning(f"No documents updated in collection {table_name} with ID {record_id}")
+            return False
+        
+        logger.info(f"Successfully updated field {column_name} for document {record_id} in collection {table_name}")
+        return True
+        
+    @_mongo_op(default=[])
+    def get_table_records(self, table_name: str, page: int = 1, page_size: int = 50, after_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get table records - wrapper for get_paginated_records"""
-        try:
-            result = self.get_paginated_records(table_name, page, page_size)
-            return result.get("records", [])
-        except Exception as e:
-            logger.error(f"Error getting table records: {e}")
-            return []
+        result = self.get_paginated_records(table_name, page, page_size, after_id=after_id, include_total=False)
+        return result.get("records", [])
     
-    def get_table_records_with_columns(self, table_name: str, columns: List[str], page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
+    @_mongo_op(default=[])
+    def get_table_records_with_columns(self, table_name: str, columns: List[str], page: int = 1, page_size: int = 50,
+                                       after_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get table records with specific columns"""
-        try:
-            result = self.get_paginated_records(table_name, page, page_size, columns)
-            return result.get("records", [])
-        except Exception as e:
-            logger.error(f"Error getting table records with columns: {e}")
-            return []
+        result = self.get_paginated_records(table_name, page, page_size, columns, after_id=after_id, include_total=False)
+        return result.get("records", [])
     
+    @_mongo_op(default=None, reraise=True)
     def create_record(self, table_name: str, data: Dict[str, Any]) -> Optional[str]:
         """Insert a new document into the collection"""
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Insert the document
+        result = self.db[table_name].insert_one(data)
+        
+        # Return the inserted ID as string
+        record_id = str(result.inserted_id)
+        invalidate_collection_count(self._target, self.db_name, table_name)
+        
+        logger.info(f"Successfully created document with ID {record_id} in collection {table_name}")
+        return record_id
+        
+    @_mongo_op(default=[])
+    def bulk_create_records(self, table_name: str, docs: List[Dict[str, Any]]) -> List[str]:
+        """Insert multiple documents into the collection in a single unordered batch"""
+        if not docs:
+            return []
+        
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Unordered inserts are sent as one command and applied in parallel by the server
         try:
-            if not self.db:
-                logger.error("No active connection")
-                return None
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Insert the document
-            result = self.db[table_name].insert_one(data)
-            
-            # Return the inserted ID as string
-            record_id = str(result.inserted_id)
-            
-            logger.info(f"Successfully created document with ID {record_id} in collection {table_name}")
-            return record_id
-            
-        except Exception as e:
-            logger.error(f"Error creating document in collection {table_name}: {e}")
-            raise e
-    
+            result = self.db[table_name].insert_many(docs, ordered=False)
+            record_ids = [str(_id) for _id in result.inserted_ids]
+        except BulkWriteError as e:
+            # Unordered: every document without a write error was still inserted (insert_many set its _id)
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            record_ids = [str(doc["_id"]) for index, doc in enumerate(docs) if index not in failed and "_id" in doc]
+            logger.error(f"Bulk insert into collection {table_name} failed for {len(failed)} of {len(docs)} documents: "
+                         f"{e.details.get('writeErrors', [])[:1]}")
+        finally:
+            # Even a partly failed batch changes the collection size
+            invalidate_collection_count(self._target, self.db_name, table_name)
+        
+        logger.info(f"Bulk created {len(record_ids)} documents in collection {table_name}")
+        return record_ids
+        
+    @_mongo_op(default=0)
+    def bulk_update_records(self, table_name: str, updates: List[Tuple[str, str, Any]]) -> int:
+        """Update multiple documents with one unordered bulk write; updates are (record_id, field, value)"""
+        if not updates:
+            return 0
+        
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        operations = [
+            UpdateOne({"_id": _to_oid(record_id)},
+                      {"$set": {column_name: new_value}})
+            for record_id, column_name, new_value in updates
+        ]
+        result = self.db[table_name].bulk_write(operations, ordered=False)
+        
+        modified_count = result.modified_count
+        logger.info(f"Bulk updated {modified_count} documents in collection {table_name}")
+        return modified_count
+        
+    @_mongo_op(default=False, reraise=True)
     def delete_record(self, table_name: str, record_id: str) -> bool:
         """Delete a document from the collection"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return False
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Convert string ID to ObjectId if needed
-            try:
-                object_id = ObjectId(record_id)
-            except:
-                object_id = record_id
-            
-            result = self.db[table_name].delete_one({"_id": object_id})
+        # Validate collection exists
+        self._validate_table_exists(table_name, fallback=False)
+        
+        # Convert string ID to ObjectId if needed
+        object_id = _to_oid(record_id)
+        
+        result = self.db[table_name].delete_one({"_id": object_id})
+        
+        if result.deleted_count > 0:
+            invalidate_collection_count(self._target, self.db_name, table_name)
+            logger.info(f"Successfully deleted document {record_id} from collection {table_name}")
+            return True
+        else:
+            logger.warning(f"No document found with ID {record_id} in collection {table_name}")
+            return False
             
-            if result.deleted_count > 0:
-                logger.info(f"Successfully deleted document {record_id} from collection {table_name}")
-                return True
-            else:
-                logger.warning(f"No document found with ID {record_id} in collection {table_name}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error deleting document from collection {table_name}: {e}")
-            raise e
-    
+    @_mongo_op(default=0)
     def bulk_delete_records(self, table_name: str, record_ids: List[str]) -> int:
         """Delete multiple documents from the collection"""
-        try:
-            if not self.db or not record_ids:
-                return 0
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Convert string IDs to ObjectIds
-            object_ids = []
-            for record_id in record_ids:
-                try:
-                    object_ids.append(ObjectId(record_id))
-                except:
-                    object_ids.append(record_id)
-            
-            result = self.db[table_name].delete_many({"_id": {"$in": object_ids}})
-            
-            deleted_count = result.deleted_count
-            logger.info(f"Bulk deleted {deleted_count} documents from collection {table_name}")
-            return deleted_count
-            
-        except Exception as e:
-            logger.error(f"Error bulk deleting documents from collection {table_name}: {e}")
+        if not record_ids:
             return 0
-    
+        
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Convert string IDs to ObjectIds
+        object_ids = [_to_oid(r) for r in record_ids]
+        
+        result = self.db[table_name].delete_many({"_id": {"$in": object_ids}})
+        
+        deleted_count = result.deleted_count
+        if deleted_count:
+            invalidate_collection_count(self._target, self.db_name, table_name)
+        logger.info(f"Bulk deleted {deleted_count} documents from collection {table_name}")
+        return deleted_count
+        
+    @_mongo_op(default=None)
     def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
         """Get a single document by ID"""
-        try:
-            if not self.db:
-                logger.error("No active connection")
-                return None
-            
-            # Validate collection exists
-            self._validate_table_exists(table_name)
-            
-            # Convert string ID to ObjectId if needed
-            try:
-                object_id = ObjectId(record_id)
-            except:
-                object_id = record_id
-            
-            document = self.db[table_name].find_one({"_id": object_id})
-            
-            if document:
-                # Convert ObjectId to string
-                if '_id' in document:
-                    document['_id'] = str(document['_id'])
-                return document
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting document from collection {table_name}: {e}")
-            return None
-            
+        # Validate collection exists
+        self._validate_table_exists(table_name)
+        
+        # Convert string ID to ObjectId if needed
+        object_id = _to_oid(record_id)
+        
+        document = self.db[table_name].find_one({"_id": object_id})
+        
+        if document:
+            # Convert ObjectId to string
+            document['_id'] = str(document['_id'])
+            return document
+        
+        return None
+        
     def close(self):
         """Close the connection"""
         if self.client:
@@ -1,14 +1,224 @@
 import pymssql
+import hashlib
 import logging
-import math  # Add this import
-from typing import List, Dict, Any, Optional, Union
+import queue
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+from .asyncConnector import AsyncConnector
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Idle connections kept per (server, port, database, user, password hash)
+POOL_SIZE = 20
+
+# Process-wide pools of idle pymssql connections; LIFO so the most recently used
+# (and most likely still alive) connection is handed out first
+_POOLS: Dict[Tuple, queue.LifoQueue] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Seconds a cached table row count stays valid
+COUNT_CACHE_TTL = 30
+
+# Seconds a cached table list stays valid
+TABLES_CACHE_TTL = 60
+
+# Seconds / entries for cached preview and by-id reads
+ROWS_CACHE_TTL = 10
+ROWS_CACHE_SIZE = 512
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after a fixed number of seconds"""
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Tuple, Tuple[Any, float]]" = OrderedDict()
+    
+    def get(self, key: Tuple) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[0]
+    
+    def set(self, key: Tuple, value: Any):
+        self._data[key] = (value, time.monotonic())
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate_table(self, table_name: Optional[str] = None):
+        """Drop entries for one table (keys are (kind, table, ...)), or everything"""
+        if table_name is None:
+            self._data.clear()
+            return
+        for key in [key for key in self._data if key[1] == table_name]:
+            del self._data[key]
+
+# Static statements, kept byte-for-byte identical across calls so SQL Server reuses cached plans.
+# pymssql uses the pyformat paramstyle, so parameters are always bound with %s.
+_STATEMENTS = {
+    "all_tables": """
+        SELECT 
+            TABLE_CATALOG AS DatabaseName,
+            TABLE_NAME AS TableName
+        FROM INFORMATION_SCHEMA.TABLES 
+        WHERE TABLE_TYPE = 'BASE TABLE'
+        ORDER BY TABLE_CATALOG, TABLE_NAME
+    """,
+    "table_names": """
+        SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES 
+        WHERE TABLE_TYPE = 'BASE TABLE'
+    """,
+    "columns_for_table": """
+        SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS 
+        WHERE TABLE_NAME = %s
+        ORDER BY ORDINAL_POSITION
+    """,
+    # Leading primary key column if there is one, otherwise the first column, in one round-trip
+    "pk_for_table": """
+        SELECT TOP 1 name FROM (
+            SELECT c.name, 0 AS source, ic.key_ordinal AS position
+            FROM sys.indexes i
+            JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            WHERE i.object_id = OBJECT_ID(%(table)s) AND i.is_primary_key = 1
+            UNION ALL
+            SELECT c.name, 1 AS source, c.column_id AS position
+            FROM sys.columns c
+            WHERE c.object_id = OBJECT_ID(%(table)s)
+        ) AS candidates
+        ORDER BY source, position
+    """,
+    "server_version": "SELECT SERVERPROPERTY('ProductVersion')",
+    "approx_row_count": """
+        SELECT SUM(row_count) FROM sys.dm_db_partition_stats
+        WHERE object_id = OBJECT_ID(%s) AND index_id IN (0, 1)
+    """,
+}
+
+# Pagination templates, filled with str.format so each strategy always produces the same text shape;
+# page bounds are server-side parameters, so the text is identical for every page of a table
+_OFFSET_FETCH_SQL = "SELECT {cols} FROM {table} ORDER BY (SELECT NULL) OFFSET @offset ROWS FETCH NEXT @limit ROWS ONLY"
+_ROW_NUMBER_SQL = (
+    "WITH PagedData AS (SELECT {cols}, ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS RowNum FROM {table}) "
+    "SELECT {cols} FROM PagedData WHERE RowNum BETWEEN @first AND @last"
+)
+_TOP_SQL = "SELECT TOP {limit} {cols} FROM {table}"
+_SP_EXECUTESQL = "EXEC sp_executesql N'{statement}', N'{declarations}', {assignments}"
+
+def _parameterized(statement: str, declarations: str) -> str:
+    """Wrap a statement in sp_executesql so its declared parameters are bound on the server"""
+    # pymssql interpolates %s on the client, so plain placeholders would still reach the server
+    # as literals and compile a new plan per page; values are passed as %s after this call
+    names = [declaration.split()[0] for declaration in declarations.split(",")]
+    return _SP_EXECUTESQL.format(
+        statement=statement.replace("'", "''").replace("%", "%%"),
+        declarations=declarations,
+        assignments=", ".join(f"{name} = %s" for name in names)
+    )
+
+# SQL Server error numbers for an unknown column (207) or object (208): the cached metadata is stale
+_METADATA_ERRORS = (207, 208)
+
+# SQL Server error for OUTPUT without INTO on a table with enabled triggers
+_OUTPUT_TRIGGER_ERROR = 334
+
+def _error_number(error: Exception) -> Optional[int]:
+    """Get the SQL Server error number carried by a pymssql exception, if any"""
+    number = getattr(error, "number", None)
+    if number is None and error.args and isinstance(error.args[0], int):
+        number = error.args[0]
+    return number
+
+def _get_pool(key: Tuple) -> queue.LifoQueue:
+    """Get (or create) the idle-connection pool for a connection key"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = queue.LifoQueue(maxsize=POOL_SIZE)
+        return pool
+
+# SQL Server accepts at most 2100 parameters per statement; batches stay well below it
+MAX_BATCH_PARAMS = 2000
+# IDs bound per DELETE ... IN (...) statement
+DELETE_CHUNK_SIZE = 1000
+
+def _padded_chunks(values: List[Any], chunk_size: int) -> Iterator[Tuple[Any, ...]]:
+    """Split values into chunks padded (by repeating the last value) to a power-of-two length"""
+    # Only a handful of distinct placeholder counts reach the server, so plans get reused
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        size = 8
+        while size < len(chunk):
+            size *= 2
+        yield tuple(chunk) + (chunk[-1],) * (min(size, chunk_size) - len(chunk))
+
+@lru_cache(maxsize=4096)
+def _q(ident: str) -> str:
+    """Quote an identifier for SQL Server, escaping any closing bracket (memoized per name)"""
+    return "[" + ident.replace("]", "]]") + "]"
+
+# Rows sent per executemany / bulk copy batch
+INSERT_CHUNK_SIZE = 1000
+
+# Upper bound on rows pulled per fetchmany round-trip
+MAX_FETCH_BATCH = 1000
+
+def _fetch_rows(cursor, batch_size: int) -> List[Any]:
+    """Drain a cursor in fetchmany batches instead of one fetchall buffer"""
+    cursor.arraysize = max(1, min(batch_size, MAX_FETCH_BATCH))
+    rows = []
+    while True:
+        chunk = cursor.fetchmany(cursor.arraysize)
+        if not chunk:
+            break
+        rows.extend(chunk)
+    return rows
+
+def _is_alive(conn: pymssql.Connection) -> bool:
+    """Cheap liveness check for a pooled connection"""
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+        return True
+    except Exception:
+        return False
+
 class MSSQLConnection:
     def __init__(self):
         self.conn = None
+        self._pool_key = None
+        # Reusable cursors for this connection (created lazily by _get_cursor)
+        self._cursor = None
+        self._dict_cursor = None
+        # Per-connection metadata caches (see invalidate_metadata)
+        self._table_exists_cache: set = set()
+        # Column names per table in ordinal order; a dict doubles as an ordered set
+        self._columns_cache: Dict[str, Dict[str, None]] = {}
+        self._pk_cache: Dict[str, str] = {}
+        self._server_major_version: Optional[int] = None
+        # table -> (row count, monotonic timestamp)
+        self._count_cache: Dict[str, Tuple[int, float]] = {}
+        # (table list, monotonic timestamp) for get_all_tables
+        self._tables_cache: Optional[Tuple[List[Dict[str, str]], float]] = None
+        # Preview / by-id results, dropped for a table whenever it is written
+        self._rows_cache = _TTLCache(ROWS_CACHE_SIZE, ROWS_CACHE_TTL)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
         
     def connect(self, server: str, database: str, user: str, password: str, port: int = 1433) -> Union[pymssql.Connection, None]:
         """Connect to Microsoft SQL Server database"""
@@ -28,8 +238,32 @@ class MSSQLConnection:
                 log_attempt['password'] = '********'
             logger.info(f"Connection attempt with parameters: {log_attempt}")
             
-            self.conn = pymssql.connect(**attempt)
-            logger.info(f"Successfully connected to SQL Server")
+            # Reuse an idle pooled connection when one is still alive
+            self._pool_key = (server, port, database, user, hashlib.sha256((password or "").encode()).hexdigest())
+            pool = _get_pool(self._pool_key)
+            self._close_cursors()
+            self.conn = None
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if _is_alive(conn):
+                    self.conn = conn
+                    logger.info("Reused pooled SQL Server connection")
+                    break
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            
+            if self.conn is None:
+                self.conn = pymssql.connect(**attempt)
+                logger.info(f"Successfully connected to SQL Server")
+            
+            # Resolve the server version once here so page fetches never query it
+            self._server_major_version = None
+            self._get_server_major_version()
             return self.conn
             
         except pymssql.OperationalError as e:
@@ -46,27 +280,21 @@ class MSSQLConnection:
                 logger.error("No active connection")
                 return []
             
-            cursor = self.conn.cursor()
+            # Table lists rarely change within a session; serve a copy of a recent listing
+            now = time.monotonic()
+            if self._tables_cache and now - self._tables_cache[1] <= TABLES_CACHE_TTL:
+                return [dict(table) for table in self._tables_cache[0]]
+            
+            cursor = self._get_cursor()
             # Query to get all tables with their database names
-            query = """
-                SELECT 
-                    TABLE_CATALOG AS DatabaseName,
-                    TABLE_NAME AS TableName
-                FROM INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_CATALOG, TABLE_NAME
-            """
-            cursor.execute(query)
+            cursor.execute(_STATEMENTS["all_tables"])
             
             # Return a list of dictionaries with database and table names
-            tables = []
-            for row in cursor.fetchall():
-                tables.append({
-                    'database': row[0],
-                    'table': row[1]
-                })
+            tables = [{'database': row[0], 'table': row[1]} for row in cursor.fetchall()]
             
-            cursor.close()
+            self._tables_cache = (tables, now)
+            self._table_exists_cache = {table['table'] for table in tables}
+            tables = [dict(table) for table in tables]
             
             logger.info(f"Found {len(tables)} tables")
             return tables
@@ -74,8 +302,8 @@ class MSSQLConnection:
             logger.error(f"Error getting tables: {e}")
             return []
     
-    def get_table_record_count(self, table_name: str) -> int:
-        """Get the total number of records in a specific table"""
+    def get_table_record_count(self, table_name: str, exact: bool = False) -> int:
+        """Get the total number of records in a specific table (from partition metadata unless exact)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
@@ -84,13 +312,8 @@ class MSSQLConnection:
             # Validate table name to prevent SQL injection
             self._validate_table_exists(table_name)
             
-            cursor = self.conn.cursor()
-            # Query to get the count of records in the table
-            query = f"SELECT COUNT(*) FROM [{table_name}]"
-            
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            # Metadata row count by default; COUNT(*) only when the caller asks for an exact value
+            count = self._get_total_count(table_name, exact=exact)
             
             logger.info(f"Found {count} records in table {table_name}")
             return count
@@ -105,21 +328,27 @@ class MSSQLConnection:
                 logger.error("No active connection")
                 return None
             
+            # Repeated previews of the same table are served from the short-lived cache
+            cached = self._rows_cache.get(("first_10", table_name))
+            if cached is not None:
+                return [dict(record) for record in cached]
+            
             # Validate table name to prevent SQL injection
             self._validate_table_exists(table_name)
             
-            cursor = self.conn.cursor(as_dict=True)
+            cursor = self._get_cursor(as_dict=True)
             # Query to get the first 10 records from the table
-            query = f"SELECT TOP 10 * FROM [{table_name}]"
+            query = f"SELECT TOP 10 * FROM {_q(table_name)}"
             
             cursor.execute(query)
-            records = cursor.fetchall()
-            cursor.close()
+            records = _fetch_rows(cursor, 10)
+            self._rows_cache.set(("first_10", table_name), records)
             
             logger.info(f"Retrieved {len(records)} records from table {table_name}")
-            return records
+            return [dict(record) for record in records]
         except Exception as e:
             logger.error(f"Error getting records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return None
             
     def get_table_columns(self, table_name: str) -> List[str]:
@@ -129,195 +358,318 @@ class MSSQLConnection:
                 logger.error("No active connection")
                 return []
             
-            cursor = self.conn.cursor()
-            # Query to get all column names for the table
-            query = """
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = %s
-                ORDER BY ORDINAL_POSITION
-            """
-            
-            cursor.execute(query, (table_name,))
-            columns = [row[0] for row in cursor.fetchall()]
-            cursor.close()
+            # Column names come from the same cached lookup used for validation
+            columns = list(self._get_column_names(table_name))
             
             logger.info(f"Found {len(columns)} columns in table {table_name}")
             return columns
         except Exception as e:
             logger.error(f"Error getting columns for table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return []
     
     def _get_primary_key_or_first_column(self, table_name: str) -> str:
         """Get the primary key column or the first column of a table for ordering"""
+        primary_key = self._pk_cache.get(table_name)
+        if primary_key:
+            return primary_key
+        
         try:
-            cursor = self.conn.cursor()
-            
-            # Try to get primary key column first
-            query = """
-                SELECT column_name
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                WHERE OBJECTPROPERTY(OBJECT_ID(constraint_name), 'IsPrimaryKey') = 1
-                AND table_name = %s
-            """
-            cursor.execute(query, (table_name,))
+            cursor = self._get_cursor()
+            
+            # Primary key column, or the first column when there is no primary key
+            cursor.execute(_STATEMENTS["pk_for_table"], {"table": table_name})
             result = cursor.fetchone()
             
             if result:
                 primary_key = result[0]
-                cursor.close()
+                self._pk_cache[table_name] = primary_key
                 return primary_key
             
-            # If no primary key, get the first column
-            query = """
-                SELECT COLUMN_NAME
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_NAME = %s
-                ORDER BY ORDINAL_POSITION
-            """
-            cursor.execute(query, (table_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                first_column = result[0]
-                cursor.close()
-                return first_column
-            
             # If all else fails, return a default column name that might exist
-            cursor.close()
             return "ID"  # Common default primary key name
             
         except Exception as e:
             logger.error(f"Error getting primary key for table {table_name}: {e}")
             return "ID"  # Fallback to a common primary key name
     
-    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
+    def _get_total_count(self, table_name: str, exact: bool = False) -> int:
+        """Get a table's row count from partition metadata (or COUNT(*) when exact), cached briefly"""
+        now = time.monotonic()
+        if not exact:
+            cached = self._count_cache.get(table_name)
+            if cached and now - cached[1] <= COUNT_CACHE_TTL:
+                return cached[0]
+        
+        cursor = self._get_cursor()
+        total_count = None
+        if not exact:
+            try:
+                # Metadata lookup instead of a clustered index scan (needs VIEW DATABASE STATE)
+                cursor.execute(_STATEMENTS["approx_row_count"], (table_name,))
+                total_count = cursor.fetchone()[0]
+            except Exception as e:
+                logger.warning(f"Could not read partition stats for table {table_name}: {e}")
+        
+        if total_count is None:
+            cursor.execute(f"SELECT COUNT(*) FROM {_q(table_name)}")
+            total_count = cursor.fetchone()[0]
+        
+        self._count_cache[table_name] = (int(total_count), now)
+        return int(total_count)
+    
+    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None,
+                              include_total: bool = True, columnar: bool = False) -> Dict[str, Any]:
         """Get paginated records from a specific table, optionally with specific columns"""
         try:
             if not self.conn:
                 logger.error("No active connection")
-                return {"records": [], "total_count": 0, "total_pages": 0}
+                return {"records": [], "total_count": 0, "total_pages": 0, "has_more": False}
             
             # Validate table exists
             self._validate_table_exists(table_name)
             
-            # Get total count for pagination info
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-            total_count = cursor.fetchone()[0]
+            # Get total count for pagination info (skipped when the caller only needs has_more)
+            total_count = None
+            total_pages = None
+            if include_total:
+                total_count = self._get_total_count(table_name)
+                total_pages = (total_count + page_size - 1) // page_size
             
-            # Calculate pagination values
-            total_pages = math.ceil(total_count / page_size)
+            # One extra row tells whether a next page exists without counting
+            offset = (page - 1) * page_size
+            fetch_size = page_size + 1
             
-            # Get paginated records with cursor as dict
-            cursor = self.conn.cursor(as_dict=True)
+            # Get paginated records with cursor as dict, or as plain tuples for the columnar shape
+            cursor = self._get_cursor(as_dict=not columnar)
             
-            # Try to determine SQL Server version to use appropriate pagination
-            try:
-                cursor.execute("SELECT SERVERPROPERTY('ProductVersion')")
-                version_str = cursor.fetchone()[0]
-                major_version = int(version_str.split('.')[0])
-            except Exception:
-                # If version check fails, assume older version
-                major_version = 0
-                logger.warning("Could not determine SQL Server version, assuming older version")
+            # SQL Server version was resolved at connect time
+            major_version = self._get_server_major_version()
             
             # If columns are specified, validate them and use only valid ones
             if columns:
                 valid_columns = self._validate_columns(table_name, columns)
-                columns_sql = ", ".join([f"[{col}]" for col in valid_columns]) if valid_columns else "*"
+                columns_sql = ", ".join([_q(col) for col in valid_columns]) if valid_columns else "*"
             else:
                 columns_sql = "*"
             
             # Try different pagination methods based on SQL Server version and capabilities
+            quoted_table = _q(table_name)
             records = None
             
             # Method 1: Modern pagination with OFFSET/FETCH (SQL Server 2012+)
             if major_version >= 11:
                 try:
-                    query = f"""
-                        SELECT {columns_sql} FROM [{table_name}]
-                        ORDER BY (SELECT NULL)
-                        OFFSET {(page - 1) * page_size} ROWS 
-                        FETCH NEXT {page_size} ROWS ONLY
-                    """
-                    cursor.execute(query)
-                    records = cursor.fetchall()
+                    query = _OFFSET_FETCH_SQL.format(cols=columns_sql, table=quoted_table)
+                    cursor.execute(_parameterized(query, "@offset BIGINT, @limit BIGINT"), (offset, fetch_size))
+                    records = _fetch_rows(cursor, fetch_size)
                     logger.info("Used OFFSET/FETCH pagination")
                 except Exception as e:
                     logger.warning(f"OFFSET/FETCH pagination failed: {e}")
+                    self._check_metadata_error(table_name, e)
                     records = None
             
             # Method 2: ROW_NUMBER() pagination (SQL Server 2005+)
             if records is None:
                 try:
-                    query = f"""
-                        WITH PagedData AS (
-                            SELECT {columns_sql}, 
-                                ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS RowNum
-                            FROM [{table_name}]
-                        )
-                        SELECT {columns_sql} FROM PagedData
-                        WHERE RowNum BETWEEN {(page - 1) * page_size + 1} AND {page * page_size}
-                    """
-                    cursor.execute(query)
-                    records = cursor.fetchall()
+                    query = _ROW_NUMBER_SQL.format(cols=columns_sql, table=quoted_table)
+                    cursor.execute(_parameterized(query, "@first BIGINT, @last BIGINT"), (offset + 1, offset + fetch_size))
+                    records = _fetch_rows(cursor, fetch_size)
                     logger.info("Used ROW_NUMBER() pagination")
                 except Exception as e:
                     logger.warning(f"ROW_NUMBER() pagination failed: {e}")
                     records = None
             
-            # Method 3: Basic TOP method (most compatible)
+            # No self-joining TOP/NOT IN fallback: it rescans the table for every page.
+            # The first page is still a plain TOP; deeper pages should use get_records_after.
             if records is None:
-                try:
-                    if page == 1:
-                        query = f"SELECT TOP {page_size} {columns_sql} FROM [{table_name}]"
-                    else:
-                        # For pages beyond the first, we need a more complex query
-                        # Get a column to use for ordering
-                        order_column = self._get_primary_key_or_first_column(table_name)
-                        
-                        query = f"""
-                            SELECT TOP {page_size} {columns_sql}
-                            FROM [{table_name}]
-                            WHERE [{order_column}] NOT IN (
-                                SELECT TOP {(page - 1) * page_size} [{order_column}]
-                                FROM [{table_name}]
-                                ORDER BY [{order_column}]
-                            )
-                            ORDER BY [{order_column}]
-                        """
-                    
-                    cursor.execute(query)
-                    records = cursor.fetchall()
-                    logger.info("Used TOP method pagination")
-                except Exception as e:
-                    logger.error(f"All pagination methods failed: {e}")
+                if page == 1:
+                    try:
+                        cursor.execute(_TOP_SQL.format(limit=fetch_size, cols=columns_sql, table=quoted_table))
+                        records = _fetch_rows(cursor, fetch_size)
+                        logger.info("Used TOP method pagination")
+                    except Exception as e:
+                        logger.error(f"All pagination methods failed: {e}")
+                        records = []
+                else:
+                    logger.error(f"All pagination methods failed for table {table_name} (page {page})")
                     records = []
             
-            cursor.close()
+            # Column names are read once from the cursor instead of being repeated in every row
+            column_names = [col[0] for col in cursor.description] if columnar and cursor.description else []
+            
+            # Trim the look-ahead row
+            records = records or []
+            has_more = len(records) > page_size
+            if has_more:
+                records = records[:page_size]
+            
+            logger.info(f"Retrieved {len(records)} records from table {table_name} (page {page}, page_size {page_size})")
             
-            logger.info(f"Retrieved {len(records) if records else 0} records from table {table_name} (page {page}, page_size {page_size})")
+            if columnar:
+                return {
+                    "columns": column_names,
+                    "rows": records,
+                    "total_count": total_count,
+                    "total_pages": total_pages,
+                    "has_more": has_more
+                }
             
             return {
-                "records": records or [],
+                "records": records,
                 "total_count": total_count,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "has_more": has_more
             }
         except Exception as e:
             logger.error(f"Error getting paginated records from table {table_name}: {e}")
-            return {"records": [], "total_count": 0, "total_pages": 0}
+            self._check_metadata_error(table_name, e)
+            return {"records": [], "total_count": 0, "total_pages": 0, "has_more": False}
+
+    def iter_records(self, table_name: str, columns: List[str] = None, batch_size: int = MAX_FETCH_BATCH) -> Iterator[Dict[str, Any]]:
+        """Stream every record of a table in fetchmany batches, optionally with specific columns"""
+        if not self.conn:
+            logger.error("No active connection")
+            return
+        
+        # Validate table exists
+        self._validate_table_exists(table_name)
+        
+        # If columns are specified, validate them and use only valid ones
+        if columns:
+            valid_columns = self._validate_columns(table_name, columns)
+            columns_sql = ", ".join([_q(col) for col in valid_columns]) if valid_columns else "*"
+        else:
+            columns_sql = "*"
+        
+        # The connection can't run other queries until the generator is exhausted or closed
+        cursor = self.conn.cursor(as_dict=True)
+        try:
+            cursor.execute(f"SELECT {columns_sql} FROM {_q(table_name)}")
+            cursor.arraysize = max(1, min(batch_size, MAX_FETCH_BATCH))
+            while True:
+                chunk = cursor.fetchmany(cursor.arraysize)
+                if not chunk:
+                    break
+                yield from chunk
+        except Exception as e:
+            self._check_metadata_error(table_name, e)
+            raise
+        finally:
+            cursor.close()
+    
+    def get_records_after(self, table_name: str, page_size: int = 50, cursor: Any = None, columns: List[str] = None) -> Dict[str, Any]:
+        """Get the next page of records after a key (keyset pagination), optionally with specific columns"""
+        try:
+            if not self.conn:
+                logger.error("No active connection")
+                return {"records": [], "next_cursor": None}
+
+            # Validate table exists
+            self._validate_table_exists(table_name)
+
+            # Rows are ordered and seeked on the primary key (or first column)
+            order_column = self._get_primary_key_or_first_column(table_name)
+
+            # If columns are specified, validate them; the key column is always selected for the next cursor
+            if columns:
+                valid_columns = self._validate_columns(table_name, columns)
+                if valid_columns and order_column not in valid_columns:
+                    valid_columns.append(order_column)
+                columns_sql = ", ".join([_q(col) for col in valid_columns]) if valid_columns else "*"
+            else:
+                columns_sql = "*"
+
+            # Each page is an index seek past the last key instead of skipping (page - 1) * page_size rows
+            db_cursor = self._get_cursor(as_dict=True)
+            if cursor is None:
+                query = f"SELECT TOP {int(page_size)} {columns_sql} FROM {_q(table_name)} ORDER BY {_q(order_column)}"
+                db_cursor.execute(query)
+            else:
+                query = f"SELECT TOP {int(page_size)} {columns_sql} FROM {_q(table_name)} WHERE {_q(order_column)} > %s ORDER BY {_q(order_column)}"
+                db_cursor.execute(query, (cursor,))
+            records = db_cursor.fetchall()
+
+            logger.info(f"Retrieved {len(records)} records from table {table_name} after {cursor!r}")
+
+            return {
+                "records": records,
+                "next_cursor": records[-1][order_column] if records else None
+            }
+        except Exception as e:
+            logger.error(f"Error getting records after cursor from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            return {"records": [], "next_cursor": None}
+
+    def _get_cursor(self, as_dict: bool = False):
+        """Get this connection's reusable cursor (dict rows when as_dict, tuples otherwise)"""
+        # Instances are not shared between threads, so one cursor of each kind is enough
+        if as_dict:
+            if self._dict_cursor is None:
+                self._dict_cursor = self.conn.cursor(as_dict=True)
+            return self._dict_cursor
+        if self._cursor is None:
+            self._cursor = self.conn.cursor()
+        return self._cursor
+    
+    def _close_cursors(self):
+        """Close the reusable cursors before the connection is released"""
+        for cursor in (self._cursor, self._dict_cursor):
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+        self._cursor = None
+        self._dict_cursor = None
+    
+    def _get_server_major_version(self) -> int:
+        """Get the SQL Server major version (resolved at connect, re-queried only if that failed)"""
+        if self._server_major_version is None:
+            try:
+                cursor = self._get_cursor()
+                cursor.execute(_STATEMENTS["server_version"])
+                version_str = cursor.fetchone()[0]
+                self._server_major_version = int(version_str.split('.')[0])
+            except Exception:
+                # If version check fails, assume older version (not cached, so it is retried)
+                logger.warning("Could not determine SQL Server version, assuming older version")
+                return 0
+        return self._server_major_version
+    
+    def invalidate_metadata(self, table: Optional[str] = None):
+        """Drop cached table/column/primary key metadata (all tables if none given), e.g. after DDL"""
+        # Any DDL can change the table list
+        self._tables_cache = None
+        if table is None:
+            self._table_exists_cache = set()
+            self._columns_cache.clear()
+            self._pk_cache.clear()
+            self._count_cache.clear()
+            self._rows_cache.invalidate_table()
+        else:
+            self._table_exists_cache.discard(table)
+            self._columns_cache.pop(table, None)
+            self._pk_cache.pop(table, None)
+            self._count_cache.pop(table, None)
+            self._rows_cache.invalidate_table(table)
+    
+    def _check_metadata_error(self, table_name: str, error: Exception):
+        """Invalidate cached metadata when SQL Server reports an unknown table or column"""
+        if _error_number(error) in _METADATA_ERRORS:
+            self.invalidate_metadata(table_name)
     
     def _validate_table_exists(self, table_name: str) -> bool:
         """Validate that a table exists to prevent SQL injection"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(1) FROM INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_NAME = ? AND TABLE_TYPE = 'BASE TABLE'
-        """, (table_name,))
+        if table_name in self._table_exists_cache:
+            return True
         
-        exists = cursor.fetchone()[0] > 0
-        cursor.close()
+        # Cache miss: load every base table name in one round-trip
+        cursor = self._get_cursor()
+        cursor.execute(_STATEMENTS["table_names"])
+        self._table_exists_cache = {row[0] for row in cursor.fetchall()}
+        
+        exists = table_name in self._table_exists_cache
         
         if not exists:
             logger.error(f"Table '{table_name}' not found")
@@ -327,19 +679,22 @@ class MSSQLConnection:
     
     def _validate_columns(self, table_name: str, columns: List[str]) -> List[str]:
         """Validate that columns exist in the table"""
-        valid_columns = []
-        cursor = self.conn.cursor()
-        
-        for col in columns:
-            cursor.execute("""
-                SELECT COUNT(1) FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = ? AND COLUMN_NAME = ?
-            """, (table_name, col))
-            if cursor.fetchone()[0] > 0:
-                valid_columns.append(col)
-        
-        cursor.close()
-        return valid_columns
+        # One lookup of the full column set, then keep the requested columns in input order
+        existing = self._get_column_names(table_name)
+        if any(col not in existing for col in columns):
+            # Reload once in case columns were added since the metadata was cached
+            self._columns_cache.pop(table_name, None)
+            existing = self._get_column_names(table_name)
+        return [col for col in columns if col in existing]
+    
+    def _get_column_names(self, table_name: str) -> Dict[str, None]:
+        """Get a table's column names in ordinal order (cached per table)"""
+        existing = self._columns_cache.get(table_name)
+        if existing is None:
+            cursor = self._get_cursor()
+            cursor.execute(_STATEMENTS["columns_for_table"], (table_name,))
+            existing = self._columns_cache[table_name] = dict.fromkeys(row[0] for row in cursor.fetchall())
+        return existing
 
     def update_record(self, table_name: str, record_id: str, column_name: str, new_value: Any) -> bool:
         """Update a specific field in a record"""
@@ -359,18 +714,18 @@ class MSSQLConnection:
             # Get primary key column for the WHERE clause
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
+            cursor = self._get_cursor()
             
-            # Prepare and execute the update query - use ? for MSSQL
-            query = f"UPDATE [{table_name}] SET [{column_name}] = ? WHERE [{primary_key}] = ?"
+            # Prepare and execute the update query - pymssql binds parameters with %s
+            query = f"UPDATE {_q(table_name)} SET {_q(column_name)} = %s WHERE {_q(primary_key)} = %s"
             cursor.execute(query, (new_value, record_id))
             
             # Commit the changes
             self.conn.commit()
+            self._rows_cache.invalidate_table(table_name)
             
             # Check if any rows were affected
             rows_affected = cursor.rowcount
-            cursor.close()
             
             if rows_affected == 0:
                 logger.warning(f"No records updated in table {table_name} with ID {record_id}")
@@ -381,6 +736,7 @@ class MSSQLConnection:
             
         except Exception as e:
             logger.error(f"Error updating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             # Rollback in case of error
             if self.conn:
                 self.conn.rollback()
@@ -422,23 +778,37 @@ class MSSQLConnection:
             # Filter data to only include valid columns
             filtered_data = {col: data[col] for col in valid_columns if col in data}
             
-            cursor = self.conn.cursor()
+            # Get primary key column to return the new record's key
+            primary_key = self._get_primary_key_or_first_column(table_name)
+            
+            cursor = self._get_cursor()
             
             # Prepare INSERT statement
             columns = list(filtered_data.keys())
-            placeholders = ", ".join(["?"] * len(columns))
-            column_names = ", ".join([f"[{col}]" for col in columns])
+            placeholders = ", ".join(["%s"] * len(columns))
+            column_names = ", ".join([_q(col) for col in columns])
+            values = tuple(filtered_data.values())
             
-            query = f"INSERT INTO [{table_name}] ({column_names}) VALUES ({placeholders})"
-            values = list(filtered_data.values())
-            
-            cursor.execute(query, values)
+            # Return the inserted key from the INSERT itself instead of a second round-trip
+            try:
+                query = f"INSERT INTO {_q(table_name)} ({column_names}) OUTPUT INSERTED.{_q(primary_key)} VALUES ({placeholders})"
+                cursor.execute(query, values)
+                record_id = cursor.fetchone()[0]
+            except pymssql.DatabaseError as e:
+                # OUTPUT without INTO is rejected on tables with triggers (error 334); any other
+                # failure (constraint, conversion...) is a real error and must not insert twice
+                if _error_number(e) != _OUTPUT_TRIGGER_ERROR:
+                    raise
+                # SCOPE_IDENTITY ignores identities inserted by those triggers (unlike @@IDENTITY)
+                # but must run in the same batch
+                logger.warning(f"OUTPUT INSERTED failed for table {table_name}, using SCOPE_IDENTITY(): {e}")
+                query = f"INSERT INTO {_q(table_name)} ({column_names}) VALUES ({placeholders}); SELECT SCOPE_IDENTITY()"
+                cursor.execute(query, values)
+                record_id = cursor.fetchone()[0]
             self.conn.commit()
             
-            # Get the inserted record ID
-            cursor.execute("SELECT @@IDENTITY")
-            record_id = cursor.fetchone()[0]
-            cursor.close()
+            self._count_cache.pop(table_name, None)
+            self._rows_cache.invalidate_table(table_name)
             
             logger.info(f"Successfully created record with ID {record_id} in table {table_name}")
             return str(record_id)
@@ -447,6 +817,103 @@ class MSSQLConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error creating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            raise e
+    
+    def create_many(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert multiple records into the table using multi-row INSERT statements"""
+        try:
+            if not self.conn or not rows:
+                return 0
+            
+            # Validate table exists
+            self._validate_table_exists(table_name)
+            
+            # Validate the union of all row keys once; a row missing a column inserts NULL for it
+            requested = list(dict.fromkeys(key for row in rows for key in row))
+            columns = self._validate_columns(table_name, requested)
+            if not columns:
+                raise ValueError("No valid columns provided")
+            
+            column_names = ", ".join([_q(col) for col in columns])
+            row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+            
+            # A VALUES list takes at most 1000 rows, and the statement must stay under the parameter limit
+            rows_per_statement = max(1, min(1000, MAX_BATCH_PARAMS // len(columns)))
+            
+            cursor = self._get_cursor()
+            inserted_count = 0
+            for start in range(0, len(rows), rows_per_statement):
+                batch = rows[start:start + rows_per_statement]
+                query = f"INSERT INTO {_q(table_name)} ({column_names}) VALUES {', '.join([row_placeholders] * len(batch))}"
+                values = tuple(row.get(col) for row in batch for col in columns)
+                cursor.execute(query, values)
+                inserted_count += cursor.rowcount
+            self.conn.commit()
+            
+            self._count_cache.pop(table_name, None)
+            self._rows_cache.invalidate_table(table_name)
+            
+            logger.info(f"Bulk created {inserted_count} records in table {table_name}")
+            return inserted_count
+            
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error(f"Error bulk creating records in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            raise e
+    
+    def bulk_insert(self, table_name: str, rows: List[Dict[str, Any]], use_bulk_copy: bool = False) -> int:
+        """Insert many records with executemany (or a TDS bulk copy), committing once at the end"""
+        try:
+            if not self.conn or not rows:
+                return 0
+            
+            # Validate table exists
+            self._validate_table_exists(table_name)
+            
+            # Validate the union of all row keys once; a row missing a column inserts NULL for it
+            requested = list(dict.fromkeys(key for row in rows for key in row))
+            columns = self._validate_columns(table_name, requested)
+            if not columns:
+                raise ValueError("No valid columns provided")
+            
+            # BCP path through FreeTDS when the installed pymssql exposes it
+            bulk_copy = getattr(getattr(self.conn, "_conn", None), "bulk_copy", None)
+            if use_bulk_copy and bulk_copy is not None:
+                ordinals = list(self._get_column_names(table_name))
+                column_ids = [ordinals.index(col) + 1 for col in columns]
+                bulk_copy(table_name, [tuple(row.get(col) for col in columns) for row in rows],
+                          column_ids=column_ids, batch_size=INSERT_CHUNK_SIZE)
+                self.conn.commit()
+                self._count_cache.pop(table_name, None)
+                self._rows_cache.invalidate_table(table_name)
+                logger.info(f"Bulk copied {len(rows)} records into table {table_name}")
+                return len(rows)
+            
+            # One statement text for every row; executemany sends it chunk by chunk in one transaction
+            column_names = ", ".join([_q(col) for col in columns])
+            placeholders = ", ".join(["%s"] * len(columns))
+            query = f"INSERT INTO {_q(table_name)} ({column_names}) VALUES ({placeholders})"
+            
+            cursor = self._get_cursor()
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                chunk = rows[start:start + INSERT_CHUNK_SIZE]
+                cursor.executemany(query, [tuple(row.get(col) for col in columns) for row in chunk])
+            self.conn.commit()
+            
+            self._count_cache.pop(table_name, None)
+            self._rows_cache.invalidate_table(table_name)
+            
+            logger.info(f"Bulk inserted {len(rows)} records into table {table_name}")
+            return len(rows)
+            
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error(f"Error bulk inserting records into table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def delete_record(self, table_name: str, record_id: str) -> bool:
@@ -462,15 +929,16 @@ class MSSQLConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            query = f"DELETE FROM [{table_name}] WHERE [{primary_key}] = ?"
+            cursor = self._get_cursor()
+            query = f"DELETE FROM {_q(table_name)} WHERE {_q(primary_key)} = %s"
             cursor.execute(query, (record_id,))
             self.conn.commit()
             
             rows_affected = cursor.rowcount
-            cursor.close()
             
             if rows_affected > 0:
+                self._count_cache.pop(table_name, None)
+                self._rows_cache.invalidate_table(table_name)
                 logger.info(f"Successfully deleted record {record_id} from table {table_name}")
                 return True
             else:
@@ -481,6 +949,7 @@ class MSSQLConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error deleting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def bulk_delete_records(self, table_name: str, record_ids: List[str]) -> int:
@@ -495,17 +964,19 @@ class MSSQLConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            
-            # Create placeholders for IN clause
-            placeholders = ", ".join(["?"] * len(record_ids))
-            delete_query = f"DELETE FROM [{table_name}] WHERE [{primary_key}] IN ({placeholders})"
+            cursor = self._get_cursor()
             
-            cursor.execute(delete_query, record_ids)
+            # Delete in chunks that stay under the parameter limit, all in one transaction
+            deleted_count = 0
+            for chunk in _padded_chunks(list(record_ids), DELETE_CHUNK_SIZE):
+                placeholders = ", ".join(["%s"] * len(chunk))
+                delete_query = f"DELETE FROM {_q(table_name)} WHERE {_q(primary_key)} IN ({placeholders})"
+                cursor.execute(delete_query, chunk)
+                deleted_count += cursor.rowcount
             self.conn.commit()
             
-            deleted_count = cursor.rowcount
-            cursor.close()
+            self._count_cache.pop(table_name, None)
+            self._rows_cache.invalidate_table(table_name)
             
             logger.info(f"Bulk deleted {deleted_count} records from table {table_name}")
             return deleted_count
@@ -514,6 +985,7 @@ class MSSQLConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error bulk deleting records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return 0
     
     def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
@@ -523,29 +995,78 @@ class MSSQLConnection:
                 logger.error("No active connection")
                 return None
             
+            cache_key = ("by_id", table_name, record_id)
+            cached = self._rows_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+            
             # Validate table exists
             self._validate_table_exists(table_name)
             
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor(as_dict=True)
-            query = f"SELECT * FROM [{table_name}] WHERE [{primary_key}] = ?"
+            cursor = self._get_cursor(as_dict=True)
+            query = f"SELECT * FROM {_q(table_name)} WHERE {_q(primary_key)} = %s"
             cursor.execute(query, (record_id,))
             
             record = cursor.fetchone()
-            cursor.close()
+            if record is None:
+                return None
             
-            return record
+            self._rows_cache.set(cache_key, record)
+            return dict(record)
             
         except Exception as e:
             logger.error(f"Error getting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return None
     
-    def close(self):
-        """Close the connection"""
-        if self.conn:
-            self.conn.close()
+    def release(self):
+        """Return the connection to the pool (closing it if the pool is full)"""
+        if not self.conn:
+            return
+        self._close_cursors()
+        conn, self.conn = self.conn, None
+        try:
+            # Never hand out a connection with an open transaction
+            conn.rollback()
+            if self._pool_key is None:
+                raise queue.Full
+            _get_pool(self._pool_key).put_nowait(conn)
+            logger.info("Connection returned to pool")
+        except Exception:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing connection: {e}")
             logger.info("Connection closed")
-            self.conn = None
+    
+    def close(self):
+        """Close the connection (returns it to the connection pool)"""
+        self.release()
+
 
+# MSSQLConnection methods exposed as coroutines by AsyncMSSQLConnection
+_ASYNC_METHODS = (
+    "get_all_tables",
+    "get_table_record_count",
+    "get_first_10_records",
+    "get_table_columns",
+    "get_paginated_records",
+    "get_records_after",
+    "update_record",
+    "get_table_records",
+    "get_table_records_with_columns",
+    "create_record",
+    "create_many",
+    "bulk_insert",
+    "delete_record",
+    "bulk_delete_records",
+    "get_record_by_id",
+)
+
+class AsyncMSSQLConnection(AsyncConnector):
+    """Asyncio facade over MSSQLConnection that runs each call on a worker thread"""
+    def __init__(self):
+        super().__init__(MSSQLConnection, POOL_SIZE, "SQL Server", _ASYNC_METHODS)
@@ -1,15 +1,119 @@
 import mysql.connector
+from mysql.connector import errorcode, pooling
+import hashlib
 import logging
 import math  # Add this import
-from typing import List, Dict, Any, Optional, Union
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+from .asyncConnector import AsyncConnector
 
 logger = logging.getLogger(__name__)
 
+# Offsets below this use a plain LIMIT/OFFSET; deeper pages use a deferred join on the primary key
+DEFERRED_JOIN_MIN_OFFSET = 1000
+
+# Tables estimated below this many rows are still counted exactly (InnoDB estimates are rough on small tables)
+ESTIMATED_COUNT_MIN_ROWS = 100000
+
+# IDs per DELETE ... IN (...) statement, keeping packets and lock footprint bounded
+DELETE_CHUNK_SIZE = 1000
+
+# Rows per multi-row INSERT statement, keeping each statement well under max_allowed_packet
+INSERT_CHUNK_SIZE = 1000
+
+# Prepared statements kept open per connector (least recently used are closed first)
+PREPARED_CACHE_SIZE = 64
+
+# Connections kept per (server, port, database, user, password hash)
+POOL_SIZE = 10
+
+# Process-wide connection pools, created on first use for each connection target
+_POOLS: Dict[Tuple, pooling.MySQLConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Connection targets whose server settings have already been checked
+_CHECKED_TARGETS: set = set()
+
+# Connections opened so far by each pool, keyed by pool name; pools grow on demand up to POOL_SIZE
+_POOL_OPENED: Dict[str, int] = {}
+
+def _get_pool(key: Tuple, connection_params: Dict[str, Any]) -> pooling.MySQLConnectionPool:
+    """Get (or create) the connection pool for a connection target"""
+    pool = _POOLS.get(key)
+    if pool is not None:
+        return pool
+    
+    # Pool names are limited to 64 characters from a small alphabet, so hash the key
+    pool_name = "dbexplorer_" + hashlib.sha1(repr(key).encode()).hexdigest()
+    # Without connection arguments the pool opens nothing up front; set_config only stores them
+    pool = pooling.MySQLConnectionPool(pool_name=pool_name, pool_size=POOL_SIZE, pool_reset_session=False)
+    pool.set_config(**connection_params)
+    with _POOLS_LOCK:
+        # A pool built by a concurrent caller wins; the empty one built here is just dropped
+        return _POOLS.setdefault(key, pool)
+
+def _pool_connection(pool: pooling.MySQLConnectionPool) -> pooling.PooledMySQLConnection:
+    """Borrow an idle pooled connection, opening a new one while the pool is below POOL_SIZE"""
+    while True:
+        try:
+            return pool.get_connection()
+        except pooling.PoolError:
+            # Reserve a slot under the lock; the connection itself is opened outside it
+            with _POOLS_LOCK:
+                opened = _POOL_OPENED.get(pool.pool_name, 0)
+                if opened >= POOL_SIZE:
+                    raise
+                _POOL_OPENED[pool.pool_name] = opened + 1
+        try:
+            pool.add_connection()
+        except Exception:
+            with _POOLS_LOCK:
+                _POOL_OPENED[pool.pool_name] -= 1
+            raise
+        # Another thread may take the new connection first; then try again for another slot
+
+# Seconds a table's column/primary key metadata is trusted before it is read again
+SCHEMA_CACHE_TTL = 300
+
+# Process-wide schema cache: (server, port, database, table) -> (expires_at, {"columns": [...], "pk": [...]})
+_SCHEMA_CACHE: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+# Table names per database: (server, port, database) -> (expires_at, [table, ...]), filled by the same load
+_TABLES_CACHE: Dict[Tuple, Tuple[float, List[str]]] = {}
+
+@lru_cache(maxsize=4096)
+def _q(ident: str) -> str:
+    """Quote a MySQL identifier with backticks (escaping embedded backticks)"""
+    return "`" + ident.replace("`", "``") + "`"
+
+def _build_schema(table_name: str, rows: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Build a schema cache entry from ordered (COLUMN_NAME, COLUMN_KEY) rows"""
+    return {
+        "columns": [row[0] for row in rows],
+        "column_set": frozenset(row[0] for row in rows),
+        "pk": [row[0] for row in rows if row[1] == 'PRI'],
+        # Pre-quoted identifiers for building SQL on hot paths
+        "quoted_table": _q(table_name),
+        "quoted_columns": {row[0]: _q(row[0]) for row in rows}
+    }
+
+# Errors that mean the cached schema no longer matches the server
+_SCHEMA_ERRORS = (errorcode.ER_NO_SUCH_TABLE, errorcode.ER_BAD_FIELD_ERROR)
+
 class MySQLConnection:
     def __init__(self):
         self.conn = None
+        self._target = None
+        self._prepared: "OrderedDict[str, Tuple[Any, str]]" = OrderedDict()
 
-    def connect(self, server: str, database: str, user: str, password: str, port: int = 3306) -> Union[mysql.connector.connection.MySQLConnection, None]:
+    def connect(self, server: str, database: str, user: str, password: str, port: int = 3306,
+                prewarm_schema: bool = True) -> Union[mysql.connector.connection.MySQLConnection, None]:
         try:
             logger.info(f"Connecting to MySQL database {database} on {server}:{port}")
             
@@ -24,6 +128,9 @@ class MySQLConnection:
             # Only add password if it's not empty
             if password:
                 connection_params["password"] = password
+            
+            # Prefer the C extension for faster result decoding; use the pure Python protocol if it isn't built
+            connection_params["use_pure"] = not getattr(mysql.connector, "HAVE_CEXT", False)
                 
             # Log connection attempt with masked password for debugging
             log_params = connection_params.copy()
@@ -31,38 +138,99 @@ class MySQLConnection:
                 log_params['password'] = '********'
             logger.info(f"MySQL connection attempt with parameters: {log_params}")
             
-            self.conn = mysql.connector.connect(**connection_params)
+            # Borrow a pooled connection instead of a fresh TCP/auth handshake per connector
+            key = (server, int(port), database, user, hashlib.sha256((password or "").encode()).hexdigest())
+            self._target = (server, int(port), database)
+            try:
+                self.conn = _pool_connection(_get_pool(key, connection_params))
+            except pooling.PoolError as e:
+                # Pool exhausted: fall back to an unpooled connection rather than failing the request
+                logger.warning(f"MySQL connection pool unavailable, connecting directly: {e}")
+                self.conn = mysql.connector.connect(**connection_params)
+            if key not in _CHECKED_TARGETS:
+                _CHECKED_TARGETS.add(key)
+                self._check_server_settings()
+            if prewarm_schema:
+                self._prewarm_schema()
             logger.info("Successfully connected to MySQL")
             return self.conn
         except Exception as e:
             logger.error(f"Error connecting to MySQL: {e}")
             return None
 
+    def _check_server_settings(self):
+        """Warn once per target when server settings slow down INFORMATION_SCHEMA queries"""
+        try:
+            with closing(self.conn.cursor()) as cursor:
+                cursor.execute("SELECT @@GLOBAL.innodb_stats_on_metadata")
+                row = cursor.fetchone()
+            # Global-only variable: it can't be turned off per session, so only report it
+            if row and int(row[0]):
+                logger.warning("innodb_stats_on_metadata is ON; INFORMATION_SCHEMA queries will recompute InnoDB statistics "
+                               "(consider SET GLOBAL innodb_stats_on_metadata=0)")
+        except Exception as e:
+            logger.warning(f"Could not check MySQL server settings: {e}")
+
+    def _prewarm_schema(self):
+        """Load the schema cache for the whole database up front (a no-op while it is still cached)"""
+        try:
+            tables = self._load_schema()
+            logger.info(f"Schema cache holds {len(tables)} tables for database {self.conn.database}")
+        except Exception as e:
+            # Metadata is loaded lazily instead; a failed prewarm must not fail the connection
+            logger.warning(f"Could not prewarm MySQL schema cache: {e}")
+
+    def _prepared_cursor(self, query: str) -> Tuple[Any, str]:
+        """Get a server-side prepared cursor for a statement and the query string to execute on it
+
+        The prepared cursor only reuses its statement when execute() is given the very same
+        string object it last ran, so callers must execute the returned string, not their own.
+        """
+        cached = self._prepared.get(query)
+        if cached is not None:
+            self._prepared.move_to_end(query)
+            return cached
+        cached = self._prepared[query] = (self.conn.cursor(prepared=True), query)
+        if len(self._prepared) > PREPARED_CACHE_SIZE:
+            _, (evicted, _) = self._prepared.popitem(last=False)
+            evicted.close()
+        return cached
+
+    def _close_prepared(self):
+        """Close every cached prepared statement"""
+        for cursor, _ in self._prepared.values():
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.warning(f"Error closing prepared statement: {e}")
+        self._prepared.clear()
+
     def get_all_tables(self) -> List[Dict[str, str]]:
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return []
-            cursor = self.conn.cursor()
-            cursor.execute("SHOW TABLES")
-            tables = [{'database': self.conn.database, 'table': row[0]} for row in cursor.fetchall()]
-            cursor.close()
+            tables = [{'database': self.conn.database, 'table': name} for name in self._load_schema()]
             logger.info(f"Found {len(tables)} tables")
             return tables
         except Exception as e:
             logger.error(f"Error getting tables: {e}")
             return []
 
-    def get_table_record_count(self, table_name: str) -> int:
+    def get_table_record_count(self, table_name: str, exact_count: bool = False) -> int:
+        """Get the number of records in a table (an InnoDB estimate for large tables unless exact_count)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return 0
-            self._validate_table_exists(table_name)
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-            count = cursor.fetchone()[0]
-            cursor.close()
+            schema = self._validate_table_exists(table_name)
+            estimate = None if exact_count else self._get_estimated_count(table_name)
+            if estimate is not None:
+                logger.info(f"Estimated {estimate} records in table {table_name}")
+                return estimate
+            with closing(self.conn.cursor()) as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM {schema['quoted_table']}")
+                count = cursor.fetchone()[0]
             logger.info(f"Found {count} records in table {table_name}")
             return count
         except Exception as e:
@@ -76,14 +244,15 @@ class MySQLConnection:
                 logger.error("No active connection")
                 return []
         
-            self._validate_table_exists(table_name)
-        
-            cursor = self.conn.cursor(dictionary=True)
-            query = f"SELECT * FROM `{table_name}` LIMIT 10"
-            cursor.execute(query)
+            schema = self._validate_table_exists(table_name)
         
-            records = cursor.fetchall()
-            cursor.close()
+            # Unbuffered: rows are read straight off the socket instead of into a client-side buffer first
+            with closing(self.conn.cursor(buffered=False)) as cursor:
+                query = f"SELECT * FROM {schema['quoted_table']} LIMIT 10"
+                cursor.execute(query)
+                # Tuple rows zipped with the column names once are cheaper than a dictionary cursor
+                column_names = cursor.column_names
+                records = [dict(zip(column_names, row)) for row in cursor]
         
             return records or []
         
@@ -96,115 +265,289 @@ class MySQLConnection:
             if not self.conn:
                 logger.error("No active connection")
                 return []
-            cursor = self.conn.cursor()
-            cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
-            columns = [row[0] for row in cursor.fetchall()]
-            cursor.close()
+            schema = self._get_table_schema(table_name)
+            if schema is None:
+                logger.error(f"Table '{table_name}' not found")
+                return []
+            columns = list(schema["columns"])
             logger.info(f"Found {len(columns)} columns in table {table_name}")
             return columns
         except Exception as e:
             logger.error(f"Error getting columns for table {table_name}: {e}")
             return []
 
-    def _get_primary_key_or_first_column(self, table_name: str) -> str:
-        try:
-            cursor = self.conn.cursor()
-            # Try to get primary key
+    def _schema_target(self) -> Tuple:
+        """Key prefix for this connection's entries in the schema caches"""
+        return self._target or (None, None, self.conn.database)
+
+    def _load_schema(self) -> List[str]:
+        """Cache columns and primary keys for every table of the database in one query; returns the table names"""
+        target = self._schema_target()
+        with _SCHEMA_CACHE_LOCK:
+            cached = _TABLES_CACHE.get(target)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        with closing(self.conn.cursor()) as cursor:
+            cursor.execute("""
+                SELECT TABLE_NAME, COLUMN_NAME, COLUMN_KEY
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = %s
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, (self.conn.database,))
+            grouped: Dict[str, List[Tuple[str, str]]] = {}
+            for table, column, key in cursor.fetchall():
+                grouped.setdefault(table, []).append((column, key))
+        expires_at = time.monotonic() + SCHEMA_CACHE_TTL
+        with _SCHEMA_CACHE_LOCK:
+            for table, rows in grouped.items():
+                _SCHEMA_CACHE[target + (table,)] = (expires_at, _build_schema(table, rows))
+            _TABLES_CACHE[target] = (expires_at, list(grouped))
+        return list(grouped)
+
+    def _get_table_schema(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Get cached column names and primary key columns for a table (None if it does not exist)"""
+        key = self._schema_target() + (table_name,)
+        with _SCHEMA_CACHE_LOCK:
+            cached = _SCHEMA_CACHE.get(key)
+            tables = _TABLES_CACHE.get(key[:3])
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        if not tables or tables[0] <= time.monotonic():
+            # Refresh the whole database at once rather than one table at a time
+            self._load_schema()
+            with _SCHEMA_CACHE_LOCK:
+                cached = _SCHEMA_CACHE.get(key)
+            if cached:
+                return cached[1]
+        with closing(self.conn.cursor()) as cursor:
             cursor.execute("""
-                SELECT COLUMN_NAME
+                SELECT COLUMN_NAME, COLUMN_KEY
                 FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_KEY = 'PRI'
-                LIMIT 1
+                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+                ORDER BY ORDINAL_POSITION
             """, (self.conn.database, table_name))
-            result = cursor.fetchone()
-            if result:
-                cursor.close()
-                return result[0]
-            # Fallback to first column
-            cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
-            result = cursor.fetchone()
-            cursor.close()
-            if result:
-                return result[0]
-            return "id"
+            rows = cursor.fetchall()
+        if not rows:
+            # Missing tables are not cached so a newly created table is seen right away
+            return None
+        schema = _build_schema(table_name, rows)
+        with _SCHEMA_CACHE_LOCK:
+            _SCHEMA_CACHE[key] = (time.monotonic() + SCHEMA_CACHE_TTL, schema)
+            # The cached table list predates this table
+            _TABLES_CACHE.pop(key[:3], None)
+        return schema
+
+    def invalidate_schema(self, table_name: Optional[str] = None):
+        """Drop cached schema for one table, or for every table of this database"""
+        target = self._target or (None, None, self.conn.database if self.conn else None)
+        with _SCHEMA_CACHE_LOCK:
+            _TABLES_CACHE.pop(target, None)
+            for key in list(_SCHEMA_CACHE):
+                if key[:3] == target and (table_name is None or key[3] == table_name):
+                    del _SCHEMA_CACHE[key]
+
+    def _check_schema_error(self, table_name: str, error: Exception):
+        """Invalidate the cached schema when the server reports a missing table or column"""
+        if getattr(error, 'errno', None) in _SCHEMA_ERRORS:
+            self.invalidate_schema(table_name)
+
+    def _get_single_column_primary_key(self, table_name: str) -> Optional[str]:
+        """Get the primary key column if the table has a single-column primary key"""
+        schema = self._get_table_schema(table_name)
+        if schema and len(schema["pk"]) == 1:
+            return schema["pk"][0]
+        return None
+
+    def _resolve_key_column(self, table_name: str, pk_column: Optional[str]) -> str:
+        """Use a caller-supplied key column after checking it exists, otherwise look up the primary key"""
+        if pk_column is None:
+            return self._get_primary_key_or_first_column(table_name)
+        if not self._validate_columns(table_name, [pk_column]):
+            logger.error(f"Column '{pk_column}' not found in table '{table_name}'")
+            raise ValueError(f"Column '{pk_column}' not found in table '{table_name}'")
+        return pk_column
+
+    def _get_primary_key_or_first_column(self, table_name: str) -> str:
+        try:
+            schema = self._get_table_schema(table_name)
+            if not schema:
+                return "id"
+            # Try primary key, fallback to first column
+            return schema["pk"][0] if schema["pk"] else schema["columns"][0]
         except Exception as e:
             logger.error(f"Error getting primary key for table {table_name}: {e}")
             return "id"
 
-    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
+    def _get_estimated_count(self, table_name: str) -> Optional[int]:
+        """Get the InnoDB row estimate for a large table (None when the table is small enough to count exactly)"""
+        schema = self._get_table_schema(table_name)
+        if schema is None:
+            return None
+        if "row_estimate" not in schema:
+            with closing(self.conn.cursor()) as cursor:
+                cursor.execute("""
+                    SELECT TABLE_ROWS FROM INFORMATION_SCHEMA.TABLES
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+                """, (self.conn.database, table_name))
+                row = cursor.fetchone()
+            # Kept for as long as the schema entry itself
+            schema["row_estimate"] = row[0] if row and row[0] is not None else 0
+        estimate = schema["row_estimate"]
+        return estimate if estimate >= ESTIMATED_COUNT_MIN_ROWS else None
+
+    def _fetch_page(self, table_name: str, page: int, page_size: int, columns: List[str] = None,
+                    after_id: Optional[str] = None, count: bool = False) -> Tuple[List[Dict[str, Any]], Any, Optional[int]]:
+        """Fetch one page of rows; returns (records, next_cursor, exact total if count else None)"""
+        schema = self._validate_table_exists(table_name)
+        table_sql = schema["quoted_table"]
+        # Keyset pages (after_id) seek on the key column; a single-column primary key also enables the deferred join
+        primary_key = self._get_single_column_primary_key(table_name)
+        order_column = primary_key or self._get_primary_key_or_first_column(table_name)
+        order_sql = _q(order_column)
+        if columns:
+            valid_columns = self._validate_columns(table_name, columns)
+            # Always select the key column so the next cursor can be returned
+            if valid_columns and order_column not in valid_columns:
+                valid_columns.append(order_column)
+            columns_sql = ", ".join([f"t.{_q(col)}" for col in valid_columns]) if valid_columns else "t.*"
+        else:
+            columns_sql = "t.*"
+        total_count = None
+        if after_id is not None:
+            # Keyset page: an index range scan from the last key, no COUNT needed
+            query = f"SELECT {columns_sql} FROM {table_sql} t WHERE t.{order_sql} > %s ORDER BY t.{order_sql} ASC LIMIT %s"
+            params = (after_id, page_size)
+        else:
+            offset = (page - 1) * page_size
+            if primary_key and offset >= DEFERRED_JOIN_MIN_OFFSET:
+                # Deferred join: skip offset rows on the narrow primary key index only, then fetch full rows
+                query = f"""
+                    SELECT {columns_sql} FROM {table_sql} t
+                    JOIN (SELECT {order_sql} FROM {table_sql} ORDER BY {order_sql} LIMIT %s OFFSET %s) k
+                    USING ({order_sql})
+                    ORDER BY t.{order_sql}
+                """
+            else:
+                order_by = f" ORDER BY t.{order_sql}" if primary_key else ""
+                query = f"SELECT {columns_sql} FROM {table_sql} t{order_by} LIMIT %s OFFSET %s"
+            params = (page_size, offset)
+            if count:
+                # SQL_CALC_FOUND_ROWS/FOUND_ROWS() are deprecated (MySQL 8.0.17) and need multi-statement execution
+                with closing(self.conn.cursor()) as cursor:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table_sql}")
+                    total_count = cursor.fetchone()[0]
+        # Tuple rows zipped with the column names once are cheaper than a dictionary cursor
+        with closing(self.conn.cursor(buffered=False)) as cursor:
+            cursor.execute(query, params)
+            column_names = cursor.column_names
+            records = [dict(zip(column_names, row)) for row in cursor]
+        next_cursor = records[-1].get(order_column) if records else None
+        return records, next_cursor, total_count
+
+    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None,
+                              after_id: Optional[str] = None, exact_count: bool = False) -> Dict[str, Any]:
+        """Get a page of records; total_count is a TABLE_ROWS estimate for large tables unless exact_count"""
         try:
             if not self.conn:
                 logger.error("No active connection")
-                return {"records": [], "total_count": 0, "total_pages": 0}
+                return {"records": [], "total_count": 0, "total_pages": 0, "next_cursor": None}
             self._validate_table_exists(table_name)
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM `{table_name}`")
-            total_count = cursor.fetchone()[0]
-            total_pages = math.ceil(total_count / page_size)
-            if columns:
-                valid_columns = self._validate_columns(table_name, columns)
-                columns_sql = ", ".join([f"`{col}`" for col in valid_columns]) if valid_columns else "*"
-            else:
-                columns_sql = "*"
-            offset = (page - 1) * page_size
-            cursor = self.conn.cursor(dictionary=True)
-            query = f"SELECT {columns_sql} FROM `{table_name}` LIMIT %s OFFSET %s"
-            cursor.execute(query, (page_size, offset))
-            records = cursor.fetchall()
-            cursor.close()
+            total_count = None
+            total_pages = None
+            if after_id is None:
+                # Large tables use the metadata estimate unless an exact count is requested
+                total_count = None if exact_count else self._get_estimated_count(table_name)
+            count = after_id is None and total_count is None
+            records, next_cursor, exact_total = self._fetch_page(table_name, page, page_size, columns, after_id, count=count)
+            if count:
+                total_count = exact_total
+            if total_count is not None:
+                total_pages = math.ceil(total_count / page_size)
             logger.info(f"Retrieved {len(records)} records from table {table_name} (page {page}, page_size {page_size})")
             return {
                 "records": records or [],
                 "total_count": total_count,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": next_cursor
             }
         except Exception as e:
             logger.error(f"Error getting paginated records from table {table_name}: {e}")
-            return {"records": [], "total_count": 0, "total_pages": 0}
-
-    def _validate_table_exists(self, table_name: str) -> bool:
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(1) FROM INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-        """, (self.conn.database, table_name))
-        exists = cursor.fetchone()[0] > 0
-        cursor.close()
-        if not exists:
+            self._check_schema_error(table_name, e)
+            return {"records": [], "total_count": 0, "total_pages": 0, "next_cursor": None}
+
+    def iter_paginated_records(self, table_name: str, page_size: int = 50, columns: List[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream every record of a table, reading page_size rows at a time from an unbuffered cursor"""
+        if not self.conn:
+            logger.error("No active connection")
+            return
+        schema = self._validate_table_exists(table_name)
+        if columns:
+            valid_columns = self._validate_columns(table_name, columns)
+            columns_sql = ", ".join([_q(col) for col in valid_columns]) if valid_columns else "*"
+        else:
+            columns_sql = "*"
+        # The connection can't run other queries until the generator is exhausted or closed
+        with closing(self.conn.cursor(buffered=False)) as cursor:
+            try:
+                cursor.execute(f"SELECT {columns_sql} FROM {schema['quoted_table']}")
+                column_names = cursor.column_names
+                while True:
+                    rows = cursor.fetchmany(max(1, page_size))
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(zip(column_names, row))
+            finally:
+                # A consumer that stops early leaves rows unread: closing the cursor would raise
+                # "Unread result found" and the shared connection's next query would fail
+                if self.conn.unread_result:
+                    self.conn.consume_results()
+
+    def _validate_table_exists(self, table_name: str) -> Dict[str, Any]:
+        """Validate the table exists and return its cached schema"""
+        schema = self._get_table_schema(table_name)
+        if schema is None:
             logger.error(f"Table '{table_name}' not found")
             raise ValueError(f"Table '{table_name}' not found")
-        return exists
+        return schema
 
     def _validate_columns(self, table_name: str, columns: List[str]) -> List[str]:
-        valid_columns = []
-        cursor = self.conn.cursor()
-        for col in columns:
-            cursor.execute("""
-                SELECT COUNT(1) FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-            """, (self.conn.database, table_name, col))
-            if cursor.fetchone()[0] > 0:
-                valid_columns.append(col)
-        cursor.close()
-        return valid_columns
-
-    def update_record(self, table_name: str, record_id: str, column_name: str, new_value: Any) -> bool:
+        schema = self._get_table_schema(table_name)
+        if not schema:
+            return []
+        unknown = [col for col in columns if col not in schema["column_set"]]
+        if unknown:
+            # Re-check unknown names in one round-trip in case columns were added since the schema was cached
+            placeholders = ', '.join(['%s'] * len(unknown))
+            with closing(self.conn.cursor()) as cursor:
+                cursor.execute(f"""
+                    SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME IN ({placeholders})
+                """, (self.conn.database, table_name, *unknown))
+                added = {row[0] for row in cursor.fetchall()}
+            if added:
+                self.invalidate_schema(table_name)
+                schema = self._get_table_schema(table_name) or schema
+        return [col for col in columns if col in schema["column_set"]]
+
+    def update_record(self, table_name: str, record_id: str, column_name: str, new_value: Any, pk_column: Optional[str] = None) -> bool:
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return False
-            self._validate_table_exists(table_name)
+            schema = self._validate_table_exists(table_name)
             valid_columns = self._validate_columns(table_name, [column_name])
             if not valid_columns:
                 logger.error(f"Column '{column_name}' not found in table '{table_name}'")
                 raise ValueError(f"Column '{column_name}' not found in table '{table_name}'")
-            primary_key = self._get_primary_key_or_first_column(table_name)
-            cursor = self.conn.cursor()
-            query = f"UPDATE `{table_name}` SET `{column_name}` = %s WHERE `{primary_key}` = %s"
+            primary_key = self._resolve_key_column(table_name, pk_column)
+            # A column added since the schema was cached is valid but not yet pre-quoted
+            column_sql = schema["quoted_columns"].get(column_name) or _q(column_name)
+            query = f"UPDATE {schema['quoted_table']} SET {column_sql} = %s WHERE {_q(primary_key)} = %s"
+            cursor, query = self._prepared_cursor(query)
             cursor.execute(query, (new_value, record_id))
             self.conn.commit()
             rows_affected = cursor.rowcount
-            cursor.close()
             if rows_affected == 0:
                 logger.warning(f"No records updated in table {table_name} with ID {record_id}")
                 return False
@@ -212,6 +555,7 @@ class MySQLConnection:
             return True
         except Exception as e:
             logger.error(f"Error updating record in table {table_name}: {e}")
+            self._check_schema_error(table_name, e)
             if self.conn:
                 self.conn.rollback()
             raise e
@@ -225,57 +569,108 @@ class MySQLConnection:
                 logger.error("No database connection available")
                 return None
             
-            # Filter out None values and empty strings for non-required fields
-            filtered_data = {k: v for k, v in data.items() if v is not None and v != ''}
+            # Filter out None values and empty strings for non-required fields in a single pass
+            columns, values = [], []
+            for column, value in data.items():
+                if value is None or value == '':
+                    continue
+                columns.append(column)
+                values.append(value)
             
-            if not filtered_data:
+            if not columns:
                 logger.error("No valid data provided for record creation")
                 return None
             
-            # Build INSERT query
-            columns = list(filtered_data.keys())
+            # Build INSERT query, reusing pre-quoted identifiers when the table's schema is cached
+            schema = self._get_table_schema(table_name) or {"quoted_table": _q(table_name), "quoted_columns": {}}
+            quoted_columns = schema["quoted_columns"]
             placeholders = ', '.join(['%s'] * len(columns))
-            column_names = ', '.join([f'`{col}`' for col in columns])
+            column_names = ', '.join([quoted_columns.get(col) or _q(col) for col in columns])
             
-            query = f"INSERT INTO `{table_name}` ({column_names}) VALUES ({placeholders})"
+            query = f"INSERT INTO {schema['quoted_table']} ({column_names}) VALUES ({placeholders})"
             
-            cursor = self.conn.cursor()
-            cursor.execute(query, list(filtered_data.values()))
+            cursor, query = self._prepared_cursor(query)
+            cursor.execute(query, values)
             
             # Get the inserted record ID
             record_id = cursor.lastrowid
             
             self.conn.commit()
-            cursor.close()
             
             logger.info(f"Successfully created record in {table_name} with ID: {record_id}")
             return record_id  # This returns an integer, which is correct
             
         except Exception as e:
             logger.error(f"Error creating record in {table_name}: {e}")
+            self._check_schema_error(table_name, e)
             if self.conn:
                 self.conn.rollback()
             return None
 
-    def delete_record(self, table_name: str, record_id: str) -> bool:
-        """Delete a record from the table"""
+    def bulk_create_records(self, table_name: str, rows: List[Dict[str, Any]], on_duplicate_update: bool = False) -> List[int]:
+        """Insert multiple records using multi-row INSERT statements in one transaction; returns the generated IDs"""
+        try:
+            if not self.conn or not rows:
+                return []
+            
+            schema = self._validate_table_exists(table_name)
+            
+            # Validate the union of all row keys once; a row missing a column inserts NULL for it
+            requested = list(dict.fromkeys(key for row in rows for key in row))
+            columns = self._validate_columns(table_name, requested)
+            if not columns:
+                raise ValueError("No valid columns provided")
+            
+            column_names = ', '.join([_q(col) for col in columns])
+            row_placeholders = "(" + ', '.join(['%s'] * len(columns)) + ")"
+            upsert_sql = ""
+            if on_duplicate_update:
+                upsert_sql = " ON DUPLICATE KEY UPDATE " + ', '.join([f"{_q(col)} = VALUES({_q(col)})" for col in columns])
+            
+            if self.conn.in_transaction:
+                # End the implicit read snapshot left open by earlier queries
+                self.conn.rollback()
+            self.conn.start_transaction()
+            record_ids: List[int] = []
+            with closing(self.conn.cursor()) as cursor:
+                for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                    batch = rows[start:start + INSERT_CHUNK_SIZE]
+                    query = f"INSERT INTO {schema['quoted_table']} ({column_names}) VALUES {', '.join([row_placeholders] * len(batch))}{upsert_sql}"
+                    cursor.execute(query, [row.get(col) for row in batch for col in columns])
+                    # lastrowid is the first ID of the statement; consecutive IDs assume innodb_autoinc_lock_mode < 2
+                    # and auto_increment_increment = 1, and do not apply to upserted rows
+                    if cursor.lastrowid and not on_duplicate_update:
+                        record_ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(batch)))
+            self.conn.commit()
+            
+            logger.info(f"Bulk created {len(rows)} records in table {table_name}")
+            return record_ids
+            
+        except Exception as e:
+            logger.error(f"Error bulk creating records in table {table_name}: {e}")
+            self._check_schema_error(table_name, e)
+            if self.conn:
+                self.conn.rollback()
+            raise e
+
+    def delete_record(self, table_name: str, record_id: str, pk_column: Optional[str] = None) -> bool:
+        """Delete a record from the table (by pk_column when given, otherwise the primary key)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return False
             
-            self._validate_table_exists(table_name)
+            schema = self._validate_table_exists(table_name)
             
-            # Get primary key column
-            primary_key = self._get_primary_key_or_first_column(table_name)
+            # Get key column (caller-supplied or primary key)
+            primary_key = self._resolve_key_column(table_name, pk_column)
             
-            cursor = self.conn.cursor()
-            query = f"DELETE FROM `{table_name}` WHERE `{primary_key}` = %s"
+            query = f"DELETE FROM {schema['quoted_table']} WHERE {_q(primary_key)} = %s"
+            cursor, query = self._prepared_cursor(query)
             cursor.execute(query, (record_id,))
             
             self.conn.commit()
             rows_affected = cursor.rowcount
-            cursor.close()
             
             if rows_affected > 0:
                 logger.info(f"Successfully deleted record {record_id} from table {table_name}")
@@ -286,89 +681,130 @@ class MySQLConnection:
             
         except Exception as e:
             logger.error(f"Error deleting record {record_id} from table {table_name}: {e}")
+            self._check_schema_error(table_name, e)
             if self.conn:
                 self.conn.rollback()
             return False
 
-    def bulk_delete_records(self, table_name: str, record_ids: List[str]) -> int:
-        """Delete multiple records from the table"""
+    def bulk_delete_records(self, table_name: str, record_ids: List[str], pk_column: Optional[str] = None) -> int:
+        """Delete multiple records from the table (by pk_column when given, otherwise the primary key)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return 0
             
-            self._validate_table_exists(table_name)
-            
-            # Get primary key column
-            primary_key = self._get_primary_key_or_first_column(table_name)
+            schema = self._validate_table_exists(table_name)
             
-            # Create placeholders for IN clause
-            placeholders = ', '.join(['%s'] * len(record_ids))
+            # Get key column (caller-supplied or primary key)
+            primary_key = self._resolve_key_column(table_name, pk_column)
             
-            cursor = self.conn.cursor()
-            query = f"DELETE FROM `{table_name}` WHERE `{primary_key}` IN ({placeholders})"
-            cursor.execute(query, record_ids)
+            # Delete in chunks inside one transaction so a failure rolls back every chunk
+            if self.conn.in_transaction:
+                # End the implicit read snapshot left open by earlier queries
+                self.conn.rollback()
+            self.conn.start_transaction()
+            rows_affected = 0
+            with closing(self.conn.cursor()) as cursor:
+                for start in range(0, len(record_ids), DELETE_CHUNK_SIZE):
+                    chunk = record_ids[start:start + DELETE_CHUNK_SIZE]
+                    placeholders = ', '.join(['%s'] * len(chunk))
+                    query = f"DELETE FROM {schema['quoted_table']} WHERE {_q(primary_key)} IN ({placeholders})"
+                    cursor.execute(query, chunk)
+                    rows_affected += cursor.rowcount
             
             self.conn.commit()
-            rows_affected = cursor.rowcount
-            cursor.close()
             
             logger.info(f"Successfully deleted {rows_affected} records from table {table_name}")
             return rows_affected
             
         except Exception as e:
             logger.error(f"Error bulk deleting records from table {table_name}: {e}")
+            self._check_schema_error(table_name, e)
             if self.conn:
                 self.conn.rollback()
             return 0
     
-    def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
-        """Get a single record by ID"""
+    def get_record_by_id(self, table_name: str, record_id: str, pk_column: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get a single record by ID (by pk_column when given, otherwise the primary key)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return None
             
             # Validate table exists
-            self._validate_table_exists(table_name)
+            schema = self._validate_table_exists(table_name)
             
-            # Get primary key column
-            primary_key = self._get_primary_key_or_first_column(table_name)
+            # Get key column (caller-supplied or primary key)
+            primary_key = self._resolve_key_column(table_name, pk_column)
             
-            cursor = self.conn.cursor(dictionary=True)
-            query = f"SELECT * FROM `{table_name}` WHERE `{primary_key}` = %s"
+            query = f"SELECT * FROM {schema['quoted_table']} WHERE {_q(primary_key)} = %s"
+            cursor, query = self._prepared_cursor(query)
             cursor.execute(query, (record_id,))
             
-            record = cursor.fetchone()
-            cursor.close()
+            # Prepared cursors return tuples, and the result must be drained before the statement is reused
+            rows = cursor.fetchall()
             
-            return record
+            return dict(zip(cursor.column_names, rows[0])) if rows else None
             
         except Exception as e:
             logger.error(f"Error getting record from table {table_name}: {e}")
+            self._check_schema_error(table_name, e)
             return None
 
     def get_table_records(self, table_name: str, page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
-        """Get table records - wrapper for get_paginated_records"""
+        """Get table records (one page, without counting the table)"""
         try:
-            result = self.get_paginated_records(table_name, page, page_size)
-            return result.get("records", [])
+            if not self.conn:
+                logger.error("No active connection")
+                return []
+            records, _, _ = self._fetch_page(table_name, page, page_size)
+            return records
         except Exception as e:
             logger.error(f"Error getting table records: {e}")
+            self._check_schema_error(table_name, e)
             return []
     
     def get_table_records_with_columns(self, table_name: str, columns: List[str], page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
-        """Get table records with specific columns"""
+        """Get table records with specific columns (one page, without counting the table)"""
         try:
-            result = self.get_paginated_records(table_name, page, page_size, columns)
-            return result.get("records", [])
+            if not self.conn:
+                logger.error("No active connection")
+                return []
+            records, _, _ = self._fetch_page(table_name, page, page_size, columns)
+            return records
         except Exception as e:
             logger.error(f"Error getting table records with columns: {e}")
+            self._check_schema_error(table_name, e)
             return []
         
 
     def close(self):
+        """Close the connection (pooled connections are returned to their pool)"""
         if self.conn:
+            self._close_prepared()
             self.conn.close()
             logger.info("MySQL connection closed")
             self.conn = None
+
+
+# MySQLConnection methods exposed as coroutines by AsyncMySQLConnection
+_ASYNC_METHODS = (
+    "get_all_tables",
+    "get_table_record_count",
+    "get_first_10_records",
+    "get_table_columns",
+    "get_paginated_records",
+    "update_record",
+    "create_record",
+    "bulk_create_records",
+    "delete_record",
+    "bulk_delete_records",
+    "get_record_by_id",
+    "get_table_records",
+    "get_table_records_with_columns",
+)
+
+class AsyncMySQLConnection(AsyncConnector):
+    """Asyncio facade over MySQLConnection that runs each call on a worker thread"""
+    def __init__(self):
+        super().__init__(MySQLConnection, POOL_SIZE, "MySQL", _ASYNC_METHODS)
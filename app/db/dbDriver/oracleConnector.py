@@ -1,21 +1,141 @@
 import cx_Oracle
+import hashlib
 import logging
 import math  # Add this import
-from typing import List, Dict, Any, Optional, Union
+import threading
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+from .asyncConnector import AsyncConnector
 
 logger = logging.getLogger(__name__)
 
+# Default rows fetched per round-trip; the driver default of 100 makes large reads latency-bound
+DEFAULT_ARRAYSIZE = 1000
+
+# Bytes of rows a cursor should fetch per round-trip; caps arraysize on tables with wide rows
+PREFETCH_BYTE_BUDGET = 8 * 1024 * 1024
+MAX_ARRAYSIZE = 50000
+
+# Statements kept parsed per session (the driver default of 20 is exhausted by a few page loads)
+STATEMENT_CACHE_SIZE = 200
+
+# Seconds a table's total row count is reused before it is counted again
+COUNT_CACHE_TTL = 60
+
+# Session pool sizing per (server, port, service, user, password hash)
+POOL_MIN = 2
+POOL_MAX = 20
+
+# Milliseconds to wait for a free pooled session before connecting directly
+POOL_WAIT_TIMEOUT = 5000
+
+# ORA-00942 (table or view does not exist) and ORA-00904 (invalid identifier) mean cached metadata is stale
+_METADATA_ERRORS = (942, 904)
+
+# Character column types whose declared length is used as a fixed bind size
+_CHAR_TYPES = ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR")
+
+# Process-wide session pools, created on first use for each connection target
+_POOLS: Dict[Tuple, cx_Oracle.SessionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+def _output_type_handler(cursor, name, default_type, size, precision, scale):
+    """Fetch LOB columns inline as str/bytes instead of LOB locators that each need another round-trip"""
+    if default_type in (cx_Oracle.CLOB, cx_Oracle.NCLOB):
+        return cursor.var(cx_Oracle.LONG_STRING, arraysize=cursor.arraysize)
+    if default_type == cx_Oracle.BLOB:
+        return cursor.var(cx_Oracle.LONG_BINARY, arraysize=cursor.arraysize)
+    return None
+
+def _native_number_handler(cursor, name, default_type, size, precision, scale):
+    """Fetch NUMBER columns as native machine ints/doubles (columnar reads) and LOBs inline"""
+    if default_type == cx_Oracle.NUMBER:
+        if scale == 0 and 0 < precision <= 18:
+            return cursor.var(cx_Oracle.NATIVE_INT, arraysize=cursor.arraysize)
+        return cursor.var(cx_Oracle.NATIVE_FLOAT, arraysize=cursor.arraysize)
+    return _output_type_handler(cursor, name, default_type, size, precision, scale)
+
+# Fixed-shape statements, built once per table/column by _sql
+_SQL_TEMPLATES = {
+    "count": 'SELECT COUNT(*) FROM {table}',
+    "first10": 'SELECT * FROM {table} WHERE ROWNUM <= 10',
+    "update": 'UPDATE {table} SET "{column}" = :new_value WHERE "{key}" = :record_id',
+    "delete": 'DELETE FROM {table} WHERE "{key}" = :1',
+    "getbyid": 'SELECT * FROM {table} WHERE "{key}" = :1',
+}
+
+@lru_cache(maxsize=512)
+def _sql(kind: str, table_identifier: str, key: Optional[str] = None, column: Optional[str] = None) -> str:
+    """Get the statement text of a given kind for a table, reusing the same string on every call"""
+    return _SQL_TEMPLATES[kind].format(table=table_identifier, key=key, column=column)
+
+def _get_pool(key: Tuple, user: str, password: str, dsn: str) -> cx_Oracle.SessionPool:
+    """Get (or create) the session pool for a connection target"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+    if pool is not None:
+        return pool
+    
+    # The pool logs in POOL_MIN sessions up front, so build it outside the lock
+    candidate = cx_Oracle.SessionPool(
+        user=user,
+        password=password,
+        dsn=dsn,
+        min=POOL_MIN,
+        max=POOL_MAX,
+        increment=1,
+        threaded=True,
+        getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+        wait_timeout=POOL_WAIT_TIMEOUT
+    )
+    with _POOLS_LOCK:
+        pool = _POOLS.setdefault(key, candidate)
+    if pool is not candidate:
+        # A concurrent caller registered a pool first
+        candidate.close(force=True)
+    return pool
+
 class OracleConnection:
-    def __init__(self):
+    def __init__(self, arraysize: int = DEFAULT_ARRAYSIZE, validate: bool = True):
         self.conn = None
         self.user = None
+        self._arraysize = arraysize
+        # Trusted callers can skip the all_tables existence check (identifiers are still quoted)
+        self._validate = validate
+        self._pool = None
+        # OFFSET ... FETCH NEXT needs Oracle 12c or later; set from the server version on connect
+        self._offset_fetch = True
+        # Total row count per table with the time it was taken, reused for COUNT_CACHE_TTL seconds
+        self._count_cache: Dict[str, Tuple[int, float]] = {}
+        # Table metadata caches, keyed by (owner, table)
+        self._exists_cache: Dict[Tuple[str, str], bool] = {}
+        self._cols_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._pk_cache: Dict[Tuple[str, str], str] = {}
+        # Declared length of each character column, used to size string binds
+        self._width_cache: Dict[Tuple[str, str], Dict[str, int]] = {}
+        # Average row length from optimizer statistics (None when the table was never analyzed)
+        self._row_len_cache: Dict[Tuple[str, str], Optional[int]] = {}
 
     def connect(self, server: str, database: str, user: str, password: str, port: int = 1521) -> Union[cx_Oracle.Connection, None]:
         """Connect to Oracle database"""
         try:
             # Oracle connection string: username/password@host:port/service_name
             dsn = cx_Oracle.makedsn(server, port, service_name=database)
-            self.conn = cx_Oracle.connect(user=user, password=password, dsn=dsn)
+            # Acquire a pooled session instead of paying a full logon per connector
+            key = (server, int(port), database, user, hashlib.sha256((password or "").encode()).hexdigest())
+            try:
+                self._pool = _get_pool(key, user, password, dsn)
+                self.conn = self._pool.acquire()
+            except cx_Oracle.Error as e:
+                # Pool exhausted or unavailable: fall back to a standalone session rather than failing the request
+                logger.warning(f"Oracle session pool unavailable, connecting directly: {e}")
+                self._pool = None
+                self.conn = cx_Oracle.connect(user=user, password=password, dsn=dsn)
+            self.conn.outputtypehandler = _output_type_handler
+            self.conn.stmtcachesize = STATEMENT_CACHE_SIZE
+            self._offset_fetch = int(self.conn.version.split('.')[0]) >= 12
             self.user = user.upper()  # Oracle typically uses uppercase for usernames
             logger.info(f"Successfully connected to Oracle database {database}")
             return self.conn
@@ -23,6 +143,43 @@ class OracleConnection:
             logger.error(f"Error connecting to Oracle: {e}")
             return None
 
+    def _cursor(self, arraysize: Optional[int] = None) -> cx_Oracle.Cursor:
+        """Create a cursor that fetches arraysize rows per round-trip (prefetching one extra to detect the end)"""
+        cursor = self.conn.cursor()
+        cursor.arraysize = max(1, arraysize or self._arraysize)
+        cursor.prefetchrows = cursor.arraysize + 1
+        return cursor
+
+    def _tune_cursor(self, cursor: cx_Oracle.Cursor, table_name: str) -> cx_Oracle.Cursor:
+        """Lower a cursor's arraysize so one round-trip stays within PREFETCH_BYTE_BUDGET for the table's row width"""
+        # Handle owner.table format
+        owner = self.user
+        table = table_name
+        if '.' in table_name:
+            owner, table = table_name.split('.')
+        
+        key = (owner, table)
+        if key not in self._row_len_cache:
+            try:
+                with self._cursor(1) as stats_cursor:
+                    stats_cursor.execute(
+                        "SELECT avg_row_len FROM all_tables WHERE owner = :owner AND table_name = :table_name",
+                        owner=owner, table_name=table
+                    )
+                    row = stats_cursor.fetchone()
+                self._row_len_cache[key] = row[0] if row and row[0] else None
+            except cx_Oracle.Error as e:
+                # Tuning is best effort: keep the requested arraysize
+                logger.warning(f"Error reading row length statistics for table {table_name}: {e}")
+                return cursor
+        
+        avg_row_len = self._row_len_cache[key]
+        if avg_row_len:
+            budget_rows = max(2, min(MAX_ARRAYSIZE, PREFETCH_BYTE_BUDGET // avg_row_len))
+            cursor.arraysize = min(cursor.arraysize, budget_rows)
+            cursor.prefetchrows = cursor.arraysize + 1
+        return cursor
+    
     def get_all_tables(self) -> List[Dict[str, str]]:
         """Get all table names with their owner names"""
         try:
@@ -30,7 +187,6 @@ class OracleConnection:
                 logger.error("No active connection")
                 return []
             
-            cursor = self.conn.cursor()
             # Query to get all tables accessible to the user
             query = """
                 SELECT owner, table_name
@@ -42,11 +198,13 @@ class OracleConnection:
                 )
                 ORDER BY owner, table_name
             """
-            cursor.execute(query, owner=self.user, grantee=self.user)
+            with self._cursor() as cursor:
+                cursor.execute(query, owner=self.user, grantee=self.user)
+                rows = cursor.fetchall()
             
             # Return a list of dictionaries with owner and table names
             tables = []
-            for row in cursor.fetchall():
+            for row in rows:
                 owner, table = row
                 table_name = f"{owner}.{table}" if owner != self.user else table
                 tables.append({
@@ -54,8 +212,6 @@ class OracleConnection:
                     'table': table_name
                 })
             
-            cursor.close()
-            
             logger.info(f"Found {len(tables)} tables")
             return tables
         except Exception as e:
@@ -79,13 +235,12 @@ class OracleConnection:
             # Validate table exists
             self._validate_table_exists(table_name)
             
-            cursor = self.conn.cursor()
             # Query to get the count of records in the table
-            query = f"SELECT COUNT(*) FROM {table_identifier}"
+            query = _sql("count", table_identifier)
             
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            with self._cursor() as cursor:
+                cursor.execute(query)
+                count = cursor.fetchone()[0]
             
             logger.info(f"Found {count} records in table {table_name}")
             return count
@@ -110,25 +265,16 @@ class OracleConnection:
             # Validate table exists
             self._validate_table_exists(table_name)
             
-            cursor = self.conn.cursor()
-            # Query to get columns first for dict creation
-            columns = self.get_table_columns(table_name)
-            
             # Oracle syntax for limiting rows
-            query = f"SELECT * FROM {table_identifier} WHERE ROWNUM <= 10"
-            
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            # Convert rows to dictionaries
-            records = []
-            for row in rows:
-                record = {}
-                for i, col in enumerate(columns):
-                    record[col] = row[i]
-                records.append(record)
+            query = _sql("first10", table_identifier)
             
-            cursor.close()
+            with self._cursor(10) as cursor:
+                cursor.execute(query)
+                
+                # Build dictionaries as rows are fetched, using the result's own column names
+                columns = [d[0] for d in cursor.description]
+                cursor.rowfactory = lambda *row: dict(zip(columns, row))
+                records = cursor.fetchall()
             
             logger.info(f"Retrieved {len(records)} records from table {table_name}")
             return records
@@ -149,18 +295,7 @@ class OracleConnection:
             if '.' in table_name:
                 owner, table = table_name.split('.')
             
-            cursor = self.conn.cursor()
-            # Query to get all column names for the table
-            query = """
-                SELECT column_name
-                FROM all_tab_columns
-                WHERE owner = :owner AND table_name = :table_name
-                ORDER BY column_id
-            """
-            
-            cursor.execute(query, owner=owner, table_name=table)
-            columns = [row[0] for row in cursor.fetchall()]
-            cursor.close()
+            columns = list(self._load_table_metadata(owner, table))
             
             logger.info(f"Found {len(columns)} columns in table {table_name}")
             return columns
@@ -168,6 +303,88 @@ class OracleConnection:
             logger.error(f"Error getting columns for table {table_name}: {e}")
             return []
     
+    def _load_table_metadata(self, owner: str, table: str) -> List[str]:
+        """Load (once) the ordered column names and primary key of a table in a single query"""
+        key = (owner, table)
+        if key in self._cols_cache:
+            return self._cols_cache[key]
+        
+        query = """
+            SELECT col.column_name,
+                   CASE WHEN EXISTS (
+                       SELECT 1
+                       FROM all_constraints c
+                       JOIN all_cons_columns cc ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+                       WHERE c.constraint_type = 'P'
+                       AND cc.owner = col.owner
+                       AND cc.table_name = col.table_name
+                       AND cc.column_name = col.column_name
+                   ) THEN 1 ELSE 0 END AS is_pk,
+                   col.data_type,
+                   col.char_length
+            FROM all_tab_columns col
+            WHERE col.owner = :owner AND col.table_name = :table_name
+            ORDER BY col.column_id
+        """
+        with self._cursor() as cursor:
+            cursor.execute(query, owner=owner, table_name=table)
+            rows = cursor.fetchall()
+        
+        columns = [row[0] for row in rows]
+        if columns:
+            # Only existing tables are cached so a newly created table is seen right away
+            self._cols_cache[key] = columns
+            pk_columns = [row[0] for row in rows if row[1]]
+            self._pk_cache[key] = pk_columns[0] if pk_columns else columns[0]
+            self._width_cache[key] = {row[0]: row[3] for row in rows if row[2] in _CHAR_TYPES and row[3]}
+        return columns
+    
+    def _bind_sizes(self, table_name: str, columns: List[str], rows: List[tuple]) -> List[Optional[int]]:
+        """Get setinputsizes arguments for binding rows of values into the given columns
+
+        Character columns bound only with strings get their declared length so the bind buffer
+        is sized once; anything else is left to the driver (None) so Oracle still converts it.
+        """
+        # Handle owner.table format
+        owner = self.user
+        table = table_name
+        if '.' in table_name:
+            owner, table = table_name.split('.')
+        
+        self._load_table_metadata(owner, table)
+        widths = self._width_cache.get((owner, table), {})
+        sizes = []
+        for i, col in enumerate(columns):
+            width = widths.get(col)
+            if width and all(row[i] is None or isinstance(row[i], str) for row in rows):
+                sizes.append(width)
+            else:
+                sizes.append(None)
+        return sizes
+    
+    def invalidate_metadata(self, table_name: Optional[str] = None):
+        """Drop cached metadata for one table, or for every table"""
+        if table_name is None:
+            self._exists_cache.clear()
+            self._cols_cache.clear()
+            self._pk_cache.clear()
+            self._width_cache.clear()
+            self._row_len_cache.clear()
+            return
+        
+        owner = self.user
+        table = table_name
+        if '.' in table_name:
+            owner, table = table_name.split('.')
+        for cache in (self._exists_cache, self._cols_cache, self._pk_cache, self._width_cache, self._row_len_cache):
+            cache.pop((owner, table), None)
+    
+    def _check_metadata_error(self, table_name: str, error: Exception):
+        """Invalidate cached metadata when Oracle reports a missing table or column"""
+        ora_error = error.args[0] if isinstance(error, cx_Oracle.Error) and error.args else None
+        if getattr(ora_error, 'code', None) in _METADATA_ERRORS:
+            self.invalidate_metadata(table_name)
+    
     def _get_primary_key_or_first_column(self, table_name: str) -> str:
         """Get the primary key column or the first column of a table for ordering"""
         try:
@@ -177,56 +394,63 @@ class OracleConnection:
             if '.' in table_name:
                 owner, table = table_name.split('.')
             
-            cursor = self.conn.cursor()
-            
-            # Try to get primary key column first
-            query = """
-                SELECT cols.column_name
-                FROM all_constraints cons, all_cons_columns cols
-                WHERE cons.constraint_type = 'P'
-                AND cons.constraint_name = cols.constraint_name
-                AND cons.owner = cols.owner
-                AND cols.owner = :owner
-                AND cols.table_name = :table_name
-            """
-            cursor.execute(query, owner=owner, table_name=table)
-            result = cursor.fetchone()
-            
-            if result:
-                primary_key = result[0]
-                cursor.close()
-                return primary_key
-            
-            # If no primary key, get the first column
-            query = """
-                SELECT column_name
-                FROM all_tab_columns
-                WHERE owner = :owner AND table_name = :table_name
-                ORDER BY column_id
-                FETCH FIRST 1 ROW ONLY
-            """
-            cursor.execute(query, owner=owner, table_name=table)
-            result = cursor.fetchone()
-            
-            if result:
-                first_column = result[0]
-                cursor.close()
-                return first_column
+            self._load_table_metadata(owner, table)
             
             # If all else fails, return a default column name that might exist
-            cursor.close()
-            return "ID"  # Common default primary key name
+            return self._pk_cache.get((owner, table), "ID")
             
         except Exception as e:
             logger.error(f"Error getting primary key for table {table_name}: {e}")
             return "ID"  # Fallback to a common primary key name
     
-    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
-        """Get paginated records from a specific table, optionally with specific columns"""
+    @staticmethod
+    def _iter_batches(cursor: cx_Oracle.Cursor) -> Iterator[List[tuple]]:
+        """Yield the remaining rows of a cursor arraysize rows at a time"""
+        while True:
+            rows = cursor.fetchmany(cursor.arraysize)
+            if not rows:
+                return
+            yield rows
+    
+    def _iter_rows(self, cursor: cx_Oracle.Cursor) -> Iterator[Dict[str, Any]]:
+        """Yield the remaining rows of a cursor as dictionaries keyed by the result's column names"""
+        columns = [d[0] for d in cursor.description]
+        for rows in self._iter_batches(cursor):
+            for row in rows:
+                yield dict(zip(columns, row))
+    
+    def iter_paginated_records(self, table_name: str, page_size: int = 50, columns: List[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream every record of a table, reading page_size rows per round-trip"""
+        if not self.conn:
+            logger.error("No active connection")
+            return
+        
+        # Handle owner.table format
+        if '.' in table_name:
+            owner, table = table_name.split('.')
+            table_identifier = f'"{owner}"."{table}"'
+        else:
+            table_identifier = f'"{table_name}"'
+        
+        # Validate table exists
+        self._validate_table_exists(table_name)
+        
+        if columns:
+            valid_columns = self._validate_columns(table_name, columns)
+            columns_sql = ", ".join([f'"{col}"' for col in valid_columns]) if valid_columns else "*"
+        else:
+            columns_sql = "*"
+        
+        with self._tune_cursor(self._cursor(page_size), table_name) as cursor:
+            cursor.execute(f"SELECT {columns_sql} FROM {table_identifier}")
+            yield from self._iter_rows(cursor)
+    
+    def get_table_records_parallel(self, table_name: str, dop: int = 4, columns: List[str] = None) -> List[Dict[str, Any]]:
+        """Get every record of a table with a parallel query of degree dop (for full-table reads and exports)"""
         try:
             if not self.conn:
                 logger.error("No active connection")
-                return {"records": [], "total_count": 0, "total_pages": 0}
+                return []
             
             # Handle owner.table format
             if '.' in table_name:
@@ -238,75 +462,147 @@ class OracleConnection:
             # Validate table exists
             self._validate_table_exists(table_name)
             
-            # Get total count for pagination info
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_identifier}")
-            total_count = cursor.fetchone()[0]
+            if columns:
+                valid_columns = self._validate_columns(table_name, columns)
+                columns_sql = ", ".join([f't."{col}"' for col in valid_columns]) if valid_columns else "t.*"
+            else:
+                columns_sql = "t.*"
             
-            # Calculate pagination values
-            total_pages = math.ceil(total_count / page_size)
+            # Hints can't take binds, so the degree is formatted in as an integer
+            dop = max(1, int(dop))
+            query = f"SELECT /*+ PARALLEL(t, {dop}) */ {columns_sql} FROM {table_identifier} t"
+            with self._tune_cursor(self._cursor(), table_name) as cursor:
+                cursor.execute(query)
+                records = list(self._iter_rows(cursor))
+            
+            logger.info(f"Retrieved {len(records)} records from table {table_name} (parallel degree {dop})")
+            return records
+        except Exception as e:
+            logger.error(f"Error getting parallel records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            return []
+    
+    def _cached_count(self, table_name: str) -> Optional[int]:
+        """Get a table's total row count if it was taken within the last COUNT_CACHE_TTL seconds"""
+        cached = self._count_cache.get(table_name)
+        if cached and time.monotonic() - cached[1] < COUNT_CACHE_TTL:
+            return cached[0]
+        return None
+    
+    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None, after_id: Any = None) -> Dict[str, Any]:
+        """Get paginated records from a specific table, optionally with specific columns
+
+        Pass the previous page's next_cursor as after_id to seek past it on the primary key
+        instead of skipping OFFSET rows.
+        """
+        try:
+            if not self.conn:
+                logger.error("No active connection")
+                return {"records": [], "total_count": 0, "total_pages": 0}
+            
+            # Handle owner.table format
+            if '.' in table_name:
+                owner, table = table_name.split('.')
+                table_identifier = f'"{owner}"."{table}"'
+            else:
+                table_identifier = f'"{table_name}"'
+            
+            # Validate table exists
+            self._validate_table_exists(table_name)
             
             # If columns are specified, validate them and use only valid ones
             if columns:
                 valid_columns = self._validate_columns(table_name, columns)
-                columns_sql = ", ".join([f'"{col}"' for col in valid_columns]) if valid_columns else "*"
+                columns_sql = ", ".join([f't."{col}"' for col in valid_columns]) if valid_columns else "t.*"
             else:
-                columns_sql = "*"
-            
-            # Oracle pagination using ROWNUM or ROW_NUMBER() window function
-            cursor = self.conn.cursor()
-            
-            # Modern Oracle versions support ROW_NUMBER() for better pagination
-            try:
-                query = f"""
-                    SELECT {columns_sql} FROM (
-                        SELECT t.*, ROW_NUMBER() OVER (ORDER BY NULL) AS rn
+                columns_sql = "t.*"
+            
+            pk_column = self._get_primary_key_or_first_column(table_name)
+            
+            # The key is selected separately so next_cursor works whatever columns were requested;
+            # the window count is only needed when no recent total is cached
+            total_count = self._cached_count(table_name)
+            helper_sql = f't."{pk_column}" AS "__KEY"'
+            if total_count is None and after_id is None:
+                helper_sql += ', COUNT(*) OVER () AS "__TOTAL"'
+            
+            with self._tune_cursor(self._cursor(page_size), table_name) as cursor:
+                if after_id is not None:
+                    # Keyset page: seek on the primary key index, no rows skipped
+                    query = f"""
+                        SELECT {columns_sql}, {helper_sql}
                         FROM {table_identifier} t
-                    )
-                    WHERE rn BETWEEN :start_row AND :end_row
-                """
-                start_row = (page - 1) * page_size + 1
-                end_row = page * page_size
-                cursor.execute(query, start_row=start_row, end_row=end_row)
-            except:
-                # Fallback for older Oracle versions
-                query = f"""
-                    SELECT {columns_sql} FROM (
-                        SELECT t.*, ROWNUM rn
+                        WHERE t."{pk_column}" > :after_id
+                        ORDER BY t."{pk_column}"
+                    """
+                    if self._offset_fetch:
+                        query += " FETCH NEXT :page_size ROWS ONLY"
+                    else:
+                        query = f"SELECT * FROM ({query}) WHERE ROWNUM <= :page_size"
+                    cursor.execute(query, after_id=after_id, page_size=page_size)
+                elif self._offset_fetch:
+                    query = f"""
+                        SELECT {columns_sql}, {helper_sql}
                         FROM {table_identifier} t
-                        WHERE ROWNUM <= :end_row
-                    )
-                    WHERE rn >= :start_row
-                """
-                start_row = (page - 1) * page_size + 1
-                end_row = page * page_size
-                cursor.execute(query, start_row=start_row, end_row=end_row)
-            
-            # Get column names for dict creation
-            all_columns = self.get_table_columns(table_name)
-            if columns:
-                all_columns = [col for col in all_columns if col in valid_columns]
-            
-            # Convert rows to dictionaries
-            rows = cursor.fetchall()
-            records = []
-            for row in rows:
-                record = {}
-                for i, col in enumerate(all_columns):
-                    record[col] = row[i]
-                records.append(record)
+                        ORDER BY t."{pk_column}"
+                        OFFSET :offset_rows ROWS FETCH NEXT :page_size ROWS ONLY
+                    """
+                    cursor.execute(query, offset_rows=(page - 1) * page_size, page_size=page_size)
+                else:
+                    # Oracle 11g and older have no OFFSET/FETCH
+                    query = f"""
+                        SELECT * FROM (
+                            SELECT {columns_sql}, {helper_sql}, ROW_NUMBER() OVER (ORDER BY t."{pk_column}") AS rn
+                            FROM {table_identifier} t
+                        )
+                        WHERE rn BETWEEN :start_row AND :end_row
+                        ORDER BY rn
+                    """
+                    start_row = (page - 1) * page_size + 1
+                    end_row = page * page_size
+                    cursor.execute(query, start_row=start_row, end_row=end_row)
+                
+                # Column names come from the result itself, up to the helper columns
+                description = [d[0] for d in cursor.description]
+                key_index = description.index("__KEY")
+                column_names = description[:key_index]
+                width = len(column_names)
+                
+                # Rows are read arraysize at a time and only their dicts are kept, the key and
+                # total being read from the last row's helper columns
+                records = []
+                last_row = None
+                for rows in self._iter_batches(cursor):
+                    records.extend(dict(zip(column_names, row[:width])) for row in rows)
+                    last_row = rows[-1]
+                
+                if total_count is None:
+                    if last_row and after_id is None:
+                        total_count = last_row[key_index + 1]
+                    elif not last_row and page <= 1 and after_id is None:
+                        total_count = 0
+                    else:
+                        # Keyset pages and pages past the end carry no window count
+                        cursor.execute(_sql("count", table_identifier))
+                        total_count = cursor.fetchone()[0]
+                    self._count_cache[table_name] = (total_count, time.monotonic())
+            
+            next_cursor = last_row[key_index] if len(records) == page_size else None
             
-            cursor.close()
+            # Calculate pagination values
+            total_pages = math.ceil(total_count / page_size)
             
             logger.info(f"Retrieved {len(records)} records from table {table_name} (page {page}, page_size {page_size})")
             
             return {
                 "records": records,
                 "total_count": total_count,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": next_cursor
             }
         except Exception as e:
             logger.error(f"Error getting paginated records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return {"records": [], "total_count": 0, "total_pages": 0}
     
     def _validate_table_exists(self, table_name: str) -> bool:
@@ -317,15 +613,24 @@ class OracleConnection:
         if '.' in table_name:
             owner, table = table_name.split('.')
         
-        cursor = self.conn.cursor()
-        query = """
-            SELECT COUNT(1) FROM all_tables 
-            WHERE owner = :owner AND table_name = :table_name
-        """
-        cursor.execute(query, owner=owner, table_name=table)
+        if not self._validate:
+            # Quoting only neutralises names that can't close the quoted identifier themselves
+            if '"' in table_name:
+                raise ValueError(f"Invalid table name '{table_name}'")
+            return True
         
-        exists = cursor.fetchone()[0] > 0
-        cursor.close()
+        # Tables already validated or described in this session are not checked again
+        exists = self._exists_cache.get((owner, table)) or ((owner, table) in self._cols_cache or None)
+        if exists is None:
+            query = """
+                SELECT COUNT(1) FROM all_tables 
+                WHERE owner = :owner AND table_name = :table_name
+            """
+            with self._cursor() as cursor:
+                cursor.execute(query, owner=owner, table_name=table)
+                exists = cursor.fetchone()[0] > 0
+            if exists:
+                self._exists_cache[(owner, table)] = True
         
         if not exists:
             logger.error(f"Table '{table_name}' not found")
@@ -341,20 +646,27 @@ class OracleConnection:
         if '.' in table_name:
             owner, table = table_name.split('.')
         
-        valid_columns = []
-        cursor = self.conn.cursor()
-        
-        for col in columns:
-            query = """
-                SELECT COUNT(1) FROM all_tab_columns 
-                WHERE owner = :owner AND table_name = :table_name AND column_name = :column_name
-            """
-            cursor.execute(query, owner=owner, table_name=table, column_name=col)
-            if cursor.fetchone()[0] > 0:
-                valid_columns.append(col)
-        
-        cursor.close()
-        return valid_columns
+        known = set(self._load_table_metadata(owner, table))
+        unknown = [col for col in columns if col not in known]
+        if unknown:
+            # Re-check unknown names with one IN-list query per 1000 names (Oracle's IN-list limit),
+            # in case columns were added since the metadata was cached
+            added = set()
+            with self._cursor() as cursor:
+                for i in range(0, len(unknown), 1000):
+                    batch = unknown[i:i + 1000]
+                    binds = {f"c{j+1}": col for j, col in enumerate(batch)}
+                    placeholders = ", ".join([f":{name}" for name in binds])
+                    query = f"""
+                        SELECT column_name FROM all_tab_columns
+                        WHERE owner = :owner AND table_name = :table_name AND column_name IN ({placeholders})
+                    """
+                    cursor.execute(query, owner=owner, table_name=table, **binds)
+                    added.update(row[0] for row in cursor.fetchall())
+            if added:
+                self.invalidate_metadata(table_name)
+                known = set(self._load_table_metadata(owner, table)) | added
+        return [col for col in columns if col in known]
     
     def update_record(self, table_name: str, record_id: str, column_name: str, new_value: Any) -> bool:
         """Update a specific field in a record"""
@@ -381,19 +693,19 @@ class OracleConnection:
             # Get primary key column for the WHERE clause
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            
             # Prepare and execute the update query
-            query = f'UPDATE {table_identifier} SET "{column_name}" = :new_value WHERE "{primary_key}" = :record_id'
-            cursor.execute(query, new_value=new_value, record_id=record_id)
+            query = _sql("update", table_identifier, primary_key, column_name)
+            value_size, id_size = self._bind_sizes(table_name, [column_name, primary_key], [(new_value, record_id)])
+            with self._cursor() as cursor:
+                cursor.setinputsizes(new_value=value_size, record_id=id_size)
+                cursor.execute(query, new_value=new_value, record_id=record_id)
+                
+                # Check if any rows were affected
+                rows_affected = cursor.rowcount
             
             # Commit the changes
             self.conn.commit()
             
-            # Check if any rows were affected
-            rows_affected = cursor.rowcount
-            cursor.close()
-            
             if rows_affected == 0:
                 logger.warning(f"No records updated in table {table_name} with ID {record_id}")
                 return False
@@ -403,6 +715,7 @@ class OracleConnection:
             
         except Exception as e:
             logger.error(f"Error updating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             # Rollback in case of error
             if self.conn:
                 self.conn.rollback()
@@ -417,6 +730,70 @@ class OracleConnection:
             logger.error(f"Error getting table records: {e}")
             return []
     
+    def get_paginated_records_columnar(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
+        """Get a page of records as one list per column instead of one dict per row
+
+        NUMBER columns are fetched as native ints/floats, so decimals beyond double precision are rounded.
+        Needs Oracle 12c or later (OFFSET/FETCH).
+        """
+        try:
+            if not self.conn:
+                logger.error("No active connection")
+                return {"columns": {}, "total_count": 0, "total_pages": 0}
+            
+            # Handle owner.table format
+            if '.' in table_name:
+                owner, table = table_name.split('.')
+                table_identifier = f'"{owner}"."{table}"'
+            else:
+                table_identifier = f'"{table_name}"'
+            
+            # Validate table exists
+            self._validate_table_exists(table_name)
+            
+            # If columns are specified, validate them and use only valid ones
+            if columns:
+                valid_columns = self._validate_columns(table_name, columns)
+                columns_sql = ", ".join([f't."{col}"' for col in valid_columns]) if valid_columns else "t.*"
+            else:
+                columns_sql = "t.*"
+            
+            pk_column = self._get_primary_key_or_first_column(table_name)
+            total_count = self._cached_count(table_name)
+            
+            query = f"""
+                SELECT {columns_sql}
+                FROM {table_identifier} t
+                ORDER BY t."{pk_column}"
+                OFFSET :offset_rows ROWS FETCH NEXT :page_size ROWS ONLY
+            """
+            with self._tune_cursor(self._cursor(page_size), table_name) as cursor:
+                cursor.outputtypehandler = _native_number_handler
+                cursor.execute(query, offset_rows=(page - 1) * page_size, page_size=page_size)
+                column_names = [d[0] for d in cursor.description]
+                rows = cursor.fetchall()
+                
+                if total_count is None:
+                    cursor.execute(_sql("count", table_identifier))
+                    total_count = cursor.fetchone()[0]
+                    self._count_cache[table_name] = (total_count, time.monotonic())
+            
+            # Transpose the row tuples into one list per column
+            values = list(zip(*rows)) if rows else [()] * len(column_names)
+            data = {name: list(column) for name, column in zip(column_names, values)}
+            
+            logger.info(f"Retrieved {len(rows)} columnar records from table {table_name} (page {page}, page_size {page_size})")
+            
+            return {
+                "columns": data,
+                "total_count": total_count,
+                "total_pages": math.ceil(total_count / page_size)
+            }
+        except Exception as e:
+            logger.error(f"Error getting columnar records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            return {"columns": {}, "total_count": 0, "total_pages": 0}
+    
     def get_table_records_with_columns(self, table_name: str, columns: List[str], page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
         """Get table records with specific columns"""
         try:
@@ -451,23 +828,26 @@ class OracleConnection:
             # Filter data to only include valid columns
             filtered_data = {col: data[col] for col in valid_columns if col in data}
             
-            cursor = self.conn.cursor()
-            
             # Prepare INSERT statement
             columns = list(filtered_data.keys())
             placeholders = ", ".join([":{}".format(i+1) for i in range(len(columns))])
             column_names = ", ".join([f'"{col}"' for col in columns])
             
-            query = f"INSERT INTO {table_identifier} ({column_names}) VALUES ({placeholders})"
+            # Return the inserted row's key in the same round-trip as the INSERT
+            primary_key = self._get_primary_key_or_first_column(table_name)
+            query = (f"INSERT INTO {table_identifier} ({column_names}) VALUES ({placeholders}) "
+                     f'RETURNING "{primary_key}" INTO :{len(columns) + 1}')
+            
             values = list(filtered_data.values())
+            with self._cursor() as cursor:
+                cursor.setinputsizes(*self._bind_sizes(table_name, columns, [values]), None)
+                out_id = cursor.var(str)
+                cursor.execute(query, values + [out_id])
+                returned = out_id.getvalue()
             
-            cursor.execute(query, values)
             self.conn.commit()
-            
-            # Get the inserted record ID (assuming first column is primary key)
-            cursor.execute(f"SELECT MAX({columns[0]}) FROM {table_identifier}")
-            record_id = cursor.fetchone()[0]
-            cursor.close()
+            self._count_cache.pop(table_name, None)
+            record_id = returned[0] if isinstance(returned, list) else returned
             
             logger.info(f"Successfully created record with ID {record_id} in table {table_name}")
             return str(record_id)
@@ -476,6 +856,51 @@ class OracleConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error creating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            raise e
+    
+    def bulk_create_records(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert multiple records with a single array-bound INSERT"""
+        try:
+            if not self.conn or not rows:
+                return 0
+            
+            # Handle owner.table format
+            if '.' in table_name:
+                owner, table = table_name.split('.')
+                table_identifier = f'"{owner}"."{table}"'
+            else:
+                table_identifier = f'"{table_name}"'
+            
+            # Validate table exists
+            self._validate_table_exists(table_name)
+            
+            # Validate the union of all row keys once; a row missing a column inserts NULL for it
+            requested = list(dict.fromkeys(key for row in rows for key in row))
+            columns = self._validate_columns(table_name, requested)
+            if not columns:
+                raise ValueError("No valid columns provided")
+            
+            placeholders = ", ".join([":{}".format(i+1) for i in range(len(columns))])
+            column_names = ", ".join([f'"{col}"' for col in columns])
+            query = f"INSERT INTO {table_identifier} ({column_names}) VALUES ({placeholders})"
+            
+            params = [tuple(row.get(col) for col in columns) for row in rows]
+            with self._cursor() as cursor:
+                cursor.setinputsizes(*self._bind_sizes(table_name, columns, params))
+                cursor.executemany(query, params)
+                inserted_count = cursor.rowcount
+            self.conn.commit()
+            self._count_cache.pop(table_name, None)
+            
+            logger.info(f"Bulk created {inserted_count} records in table {table_name}")
+            return inserted_count
+            
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error(f"Error bulk creating records in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def delete_record(self, table_name: str, record_id: str) -> bool:
@@ -498,13 +923,13 @@ class OracleConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            query = f'DELETE FROM {table_identifier} WHERE "{primary_key}" = :1'
-            cursor.execute(query, (record_id,))
+            query = _sql("delete", table_identifier, primary_key)
+            with self._cursor() as cursor:
+                cursor.setinputsizes(*self._bind_sizes(table_name, [primary_key], [(record_id,)]))
+                cursor.execute(query, (record_id,))
+                rows_affected = cursor.rowcount
             self.conn.commit()
-            
-            rows_affected = cursor.rowcount
-            cursor.close()
+            self._count_cache.pop(table_name, None)
             
             if rows_affected > 0:
                 logger.info(f"Successfully deleted record {record_id} from table {table_name}")
@@ -517,6 +942,7 @@ class OracleConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error deleting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def bulk_delete_records(self, table_name: str, record_ids: List[str]) -> int:
@@ -538,22 +964,22 @@ class OracleConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
+            # One statement array-bound with every ID: parsed once, whatever the number of IDs
+            delete_query = _sql("delete", table_identifier, primary_key)
+            params = [(record_id,) for record_id in record_ids]
+            with self._cursor() as cursor:
+                cursor.setinputsizes(*self._bind_sizes(table_name, [primary_key], params))
+                cursor.executemany(delete_query, params, batcherrors=True)
+                batch_errors = cursor.getbatcherrors()
+                total_deleted = cursor.rowcount
             
-            # Oracle doesn't support as many placeholders, so delete in batches
-            total_deleted = 0
-            batch_size = 1000
-            
-            for i in range(0, len(record_ids), batch_size):
-                batch = record_ids[i:i + batch_size]
-                placeholders = ", ".join([f":p{j+1}" for j in range(len(batch))])
-                delete_query = f'DELETE FROM {table_identifier} WHERE "{primary_key}" IN ({placeholders})'
-                
-                cursor.execute(delete_query, batch)
-                total_deleted += cursor.rowcount
+            if batch_errors:
+                for error in batch_errors:
+                    logger.error(f"Error deleting record {record_ids[error.offset]} from table {table_name}: {error.message}")
+                raise ValueError(f"{len(batch_errors)} of {len(record_ids)} records could not be deleted")
             
             self.conn.commit()
-            cursor.close()
+            self._count_cache.pop(table_name, None)
             
             logger.info(f"Bulk deleted {total_deleted} records from table {table_name}")
             return total_deleted
@@ -562,6 +988,7 @@ class OracleConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error bulk deleting records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return 0
     
     def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
@@ -584,31 +1011,54 @@ class OracleConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            query = f'SELECT * FROM {table_identifier} WHERE "{primary_key}" = :1'
-            cursor.execute(query, (record_id,))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                # Get column names and create dictionary
-                columns = self.get_table_columns(table_name)
-                record = {}
-                for i, col in enumerate(columns):
-                    record[col] = row[i]
-                cursor.close()
-                return record
+            query = _sql("getbyid", table_identifier, primary_key)
+            with self._cursor(1) as cursor:
+                cursor.execute(query, (record_id,))
+                
+                # Build the dictionary as the row is fetched, using the result's own column names
+                columns = [d[0] for d in cursor.description]
+                cursor.rowfactory = lambda *row: dict(zip(columns, row))
+                record = cursor.fetchone()
             
-            cursor.close()
-            return None
+            return record
             
         except Exception as e:
             logger.error(f"Error getting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return None
     
     def close(self):
-        """Close the connection"""
+        """Close the connection (pooled sessions are released back to their pool)"""
         if self.conn:
-            self.conn.close()
+            if self._pool is not None:
+                self._pool.release(self.conn)
+                self._pool = None
+            else:
+                self.conn.close()
             logger.info("Oracle connection closed")
-            self.conn = None
\ No newline at end of file
+            self.conn = None
+
+
+# OracleConnection methods exposed as coroutines by AsyncOracleConnection
+_ASYNC_METHODS = (
+    "get_all_tables",
+    "get_table_record_count",
+    "get_first_10_records",
+    "get_table_columns",
+    "get_paginated_records",
+    "get_paginated_records_columnar",
+    "get_table_records_parallel",
+    "update_record",
+    "create_record",
+    "bulk_create_records",
+    "delete_record",
+    "bulk_delete_records",
+    "get_record_by_id",
+    "get_table_records",
+    "get_table_records_with_columns",
+)
+
+class AsyncOracleConnection(AsyncConnector):
+    """Asyncio facade over OracleConnection that runs each call on a worker thread"""
+    def __init__(self, arraysize: int = DEFAULT_ARRAYSIZE, validate: bool = True):
+        super().__init__(OracleConnection, POOL_MAX, "Oracle", _ASYNC_METHODS, arraysize=arraysize, validate=validate)
@@ -1,26 +1,87 @@
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
+import hashlib
 import logging
 import math  # Add this import
-from typing import List, Dict, Any, Optional, Union
+import threading
+import uuid
+from contextlib import contextmanager
+from psycopg2 import pool, sql
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+from .asyncConnector import AsyncConnector
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing per (server, port, database, user, password hash)
+POOL_MIN = 1
+POOL_MAX = 10
+
+# Tables whose planner row estimate is at least this large are not counted exactly unless asked
+ESTIMATED_COUNT_MIN_ROWS = 10000
+
+# Errors meaning a table or column is gone, i.e. cached metadata is stale
+_METADATA_ERRORS = (psycopg2.errors.UndefinedTable, psycopg2.errors.UndefinedColumn)
+
+# Alias for the key column when it is read only to build the next cursor
+_KEY_ALIAS = "__KEY"
+
+# Rows per multi-row INSERT statement sent by bulk_create_records
+INSERT_PAGE_SIZE = 1000
+
+# Process-wide connection pools, created on first use for each connection target
+_POOLS: Dict[Tuple, pool.ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+def _get_pool(key: Tuple, connection_params: Dict[str, Any]) -> pool.ThreadedConnectionPool:
+    """Get (or create) the connection pool for a connection target"""
+    conn_pool = _POOLS.get(key)
+    if conn_pool is not None:
+        return conn_pool
+    
+    # The pool opens POOL_MIN connections up front, so build it outside the lock
+    candidate = pool.ThreadedConnectionPool(POOL_MIN, POOL_MAX, **connection_params)
+    with _POOLS_LOCK:
+        conn_pool = _POOLS.setdefault(key, candidate)
+    if conn_pool is not candidate:
+        # A concurrent caller registered a pool first
+        candidate.closeall()
+    return conn_pool
+
 class PostgreSQLConnection:
     def __init__(self):
         self.conn = None
         self.db_name = None
+        self._pool = None
+        # Quoted table identifiers, keyed by the table name as passed in
+        self._ident_cache: Dict[str, sql.Identifier] = {}
+        # Table metadata caches, keyed by the canonical "schema.table" name
+        self._cols_cache: Dict[str, List[str]] = {}
+        self._pk_cache: Dict[str, str] = {}
+        # Column type names with their modifiers (format_type output), used to cast array parameters
+        self._types_cache: Dict[str, Dict[str, str]] = {}
 
     def connect(self, server: str, database: str, user: str, password: str, port: int = 5432) -> Union[psycopg2.extensions.connection, None]:
         """Connect to PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(
-                host=server,
-                port=port,
-                dbname=database,
-                user=user,
-                password=password
-            )
+            connection_params = {
+                "host": server,
+                "port": port,
+                "dbname": database,
+                "user": user,
+                "password": password
+            }
+            # Borrow a pooled connection instead of a fresh TCP/auth handshake per connector
+            key = (server, int(port), database, user, hashlib.sha256((password or "").encode()).hexdigest())
+            try:
+                self._pool = _get_pool(key, connection_params)
+                self.conn = self._pool.getconn()
+            except pool.PoolError as e:
+                # Pool exhausted: fall back to an unpooled connection rather than failing the request
+                logger.warning(f"PostgreSQL connection pool unavailable, connecting directly: {e}")
+                self._pool = None
+                self.conn = psycopg2.connect(**connection_params)
             self.db_name = database
             logger.info(f"Successfully connected to PostgreSQL database {database}")
             return self.conn
@@ -28,6 +89,26 @@ class PostgreSQLConnection:
             logger.error(f"Error connecting to PostgreSQL: {e}")
             return None
 
+    def _qualify(self, table_name: str) -> sql.Identifier:
+        """Get the quoted identifier for a table name ("schema.table" or a bare table name)"""
+        identifier = self._ident_cache.get(table_name)
+        if identifier is None:
+            identifier = self._ident_cache[table_name] = sql.Identifier(*table_name.split('.'))
+        return identifier
+
+    @contextmanager
+    def _cursor(self, dict_cursor: bool = False) -> Iterator[psycopg2.extensions.cursor]:
+        """Open a cursor that is always closed, rolling back the transaction if the block fails"""
+        cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor if dict_cursor else None)
+        try:
+            yield cursor
+        except Exception:
+            # An aborted transaction would otherwise reject every later query on this connection
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
     def get_all_tables(self) -> List[Dict[str, str]]:
         """Get all table names with their schema names"""
         try:
@@ -35,7 +116,6 @@ class PostgreSQLConnection:
                 logger.error("No active connection")
                 return []
             
-            cursor = self.conn.cursor()
             # Query to get all tables
             query = """
                 SELECT table_schema, table_name
@@ -44,11 +124,13 @@ class PostgreSQLConnection:
                 AND table_schema NOT IN ('pg_catalog', 'information_schema')
                 ORDER BY table_schema, table_name
             """
-            cursor.execute(query)
+            with self._cursor() as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
             
             # Return a list of dictionaries with database and table names
             tables = []
-            for row in cursor.fetchall():
+            for row in rows:
                 schema, table = row
                 table_name = f"{schema}.{table}" if schema != 'public' else table
                 tables.append({
@@ -56,43 +138,124 @@ class PostgreSQLConnection:
                     'table': table_name
                 })
             
-            cursor.close()
-            
             logger.info(f"Found {len(tables)} tables")
             return tables
         except Exception as e:
             logger.error(f"Error getting tables: {e}")
             return []
     
-    def get_table_record_count(self, table_name: str) -> int:
-        """Get the total number of records in a specific table"""
+    def get_all_tables_with_metadata(self) -> List[Dict[str, Any]]:
+        """Get all tables with their columns, primary key and estimated row count in one query"""
         try:
             if not self.conn:
                 logger.error("No active connection")
-                return 0
+                return []
+            
+            # Same tables as get_all_tables; reltuples is the planner's row estimate (-1 if never analyzed)
+            query = """
+                SELECT n.nspname,
+                       c.relname,
+                       ARRAY(
+                           SELECT a.attname::text
+                           FROM pg_attribute a
+                           WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                           ORDER BY a.attnum
+                       ) AS columns,
+                       ARRAY(
+                           SELECT format_type(a.atttypid, a.atttypmod)
+                           FROM pg_attribute a
+                           WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                           ORDER BY a.attnum
+                       ) AS types,
+                       (
+                           SELECT a.attname::text
+                           FROM pg_index i
+                           JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                           WHERE i.indrelid = c.oid AND i.indisprimary
+                           ORDER BY a.attnum
+                           LIMIT 1
+                       ) AS pk,
+                       c.reltuples::bigint
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relkind IN ('r', 'p')
+                AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+                AND n.nspname NOT LIKE 'pg_toast%%'
+                AND has_table_privilege(c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER')
+                ORDER BY n.nspname, c.relname
+            """
+            with self._cursor() as cursor:
+                cursor.execute(query)
+                rows = cursor.fetchall()
+            
+            tables = []
+            for schema, table, columns, types, pk, reltuples in rows:
+                if columns:
+                    # Warm the metadata caches for the CRUD calls that usually follow
+                    key = f"{schema}.{table}"
+                    self._cols_cache[key] = columns
+                    self._pk_cache[key] = pk or columns[0]
+                    self._types_cache[key] = dict(zip(columns, types))
+                tables.append({
+                    'database': self.db_name,
+                    'table': f"{schema}.{table}" if schema != 'public' else table,
+                    'columns': columns,
+                    'primary_key': pk or (columns[0] if columns else None),
+                    'estimated_count': max(reltuples, 0)
+                })
             
+            logger.info(f"Found {len(tables)} tables with metadata")
+            return tables
+        except Exception as e:
+            logger.error(f"Error getting tables with metadata: {e}")
+            return []
+    
+    def _approx_count(self, schema: str, table: str) -> int:
+        """Get the planner's row estimate for a table from pg_class (0 if never analyzed)"""
+        query = """
+            SELECT c.reltuples::bigint
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s
+        """
+        with self._cursor() as cursor:
+            cursor.execute(query, (schema, table))
+            row = cursor.fetchone()
+        return max(row[0], 0) if row else 0
+    
+    def _count_records(self, table_name: str, table_identifier: sql.Identifier, exact_count: bool) -> int:
+        """Count a table's rows, using the planner estimate for large tables unless exact_count"""
+        if not exact_count:
             # Handle schema.table format
+            schema = 'public'
+            table = table_name
             if '.' in table_name:
                 schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
-            
-            # Validate table exists
-            self._validate_table_exists(table_name)
+            estimate = self._approx_count(schema, table)
+            if estimate >= ESTIMATED_COUNT_MIN_ROWS:
+                return estimate
+        
+        with self._cursor() as cursor:
+            cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(table_identifier))
+            return cursor.fetchone()[0]
+    
+    def get_table_record_count(self, table_name: str, exact_count: bool = False) -> int:
+        """Get the number of records in a table (the planner estimate for large tables unless exact_count)"""
+        try:
+            if not self.conn:
+                logger.error("No active connection")
+                return 0
             
-            cursor = self.conn.cursor()
-            # Query to get the count of records in the table
-            query = f"SELECT COUNT(*) FROM {table_identifier}"
+            table_identifier = self._qualify(table_name)
             
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            # No existence check: the quoted identifier is safe and a missing table raises UndefinedTable
+            count = self._count_records(table_name, table_identifier, exact_count)
             
             logger.info(f"Found {count} records in table {table_name}")
             return count
         except Exception as e:
             logger.error(f"Error getting record count for table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return 0
     
     def get_first_10_records(self, table_name: str) -> Optional[List[Dict[str, Any]]]:
@@ -102,30 +265,23 @@ class PostgreSQLConnection:
                 logger.error("No active connection")
                 return None
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            table_identifier = self._qualify(table_name)
             
-            # Validate table exists
-            self._validate_table_exists(table_name)
-            
-            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            # No existence check: the quoted identifier is safe and a missing table raises UndefinedTable
             # Query to get the first 10 records from the table
-            query = f"SELECT * FROM {table_identifier} LIMIT 10"
+            query = sql.SQL("SELECT * FROM {} LIMIT 10").format(table_identifier)
             
-            cursor.execute(query)
-            records = cursor.fetchall()
+            with self._cursor(dict_cursor=True) as cursor:
+                cursor.execute(query)
+                records = cursor.fetchall()
             # Convert records to dicts
             records = [dict(record) for record in records]
-            cursor.close()
             
             logger.info(f"Retrieved {len(records)} records from table {table_name}")
             return records
         except Exception as e:
             logger.error(f"Error getting records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return None
             
     def get_table_columns(self, table_name: str) -> List[str]:
@@ -141,18 +297,7 @@ class PostgreSQLConnection:
             if '.' in table_name:
                 schema, table = table_name.split('.')
             
-            cursor = self.conn.cursor()
-            # Query to get all column names for the table
-            query = """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-            """
-            
-            cursor.execute(query, (schema, table))
-            columns = [row[0] for row in cursor.fetchall()]
-            cursor.close()
+            columns = list(self._load_table_metadata(schema, table))
             
             logger.info(f"Found {len(columns)} columns in table {table_name}")
             return columns
@@ -160,6 +305,61 @@ class PostgreSQLConnection:
             logger.error(f"Error getting columns for table {table_name}: {e}")
             return []
     
+    def _load_table_metadata(self, schema: str, table: str) -> List[str]:
+        """Load (once) the ordered column names and primary key of a table in a single query"""
+        key = f"{schema}.{table}"
+        # All three caches are filled together; a partial entry is treated as a miss
+        if key in self._cols_cache and key in self._pk_cache and key in self._types_cache:
+            return self._cols_cache[key]
+        
+        query = """
+            SELECT a.attname, i.indrelid IS NOT NULL AS is_pk, format_type(a.atttypid, a.atttypmod)
+            FROM pg_attribute a
+            LEFT JOIN pg_index i ON i.indrelid = a.attrelid
+                                AND i.indisprimary
+                                AND a.attnum = ANY(i.indkey)
+            WHERE a.attrelid = (
+                SELECT c.oid
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+            )
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+            ORDER BY a.attnum
+        """
+        with self._cursor() as cursor:
+            cursor.execute(query, (schema, table))
+            rows = cursor.fetchall()
+        
+        columns = [row[0] for row in rows]
+        if columns:
+            # Only existing tables are cached so a newly created table is seen right away
+            self._cols_cache[key] = columns
+            pk_columns = [row[0] for row in rows if row[1]]
+            self._pk_cache[key] = pk_columns[0] if pk_columns else columns[0]
+            self._types_cache[key] = {row[0]: row[2] for row in rows}
+        return columns
+    
+    def invalidate_metadata(self, table_name: Optional[str] = None):
+        """Drop cached metadata for one table, or for every table"""
+        if table_name is None:
+            self._cols_cache.clear()
+            self._pk_cache.clear()
+            self._types_cache.clear()
+            return
+        
+        key = table_name if '.' in table_name else f"public.{table_name}"
+        self._cols_cache.pop(key, None)
+        self._pk_cache.pop(key, None)
+        self._types_cache.pop(key, None)
+    
+    def _check_metadata_error(self, table_name: str, error: Exception):
+        """Invalidate cached metadata when PostgreSQL reports a missing table or column"""
+        if isinstance(error, _METADATA_ERRORS):
+            self.invalidate_metadata(table_name)
+            self._ident_cache.pop(table_name, None)
+    
     def _get_primary_key_or_first_column(self, table_name: str) -> str:
         """Get the primary key column or the first column of a table for ordering"""
         try:
@@ -169,103 +369,168 @@ class PostgreSQLConnection:
             if '.' in table_name:
                 schema, table = table_name.split('.')
             
-            cursor = self.conn.cursor()
-            
-            # Try to get primary key column first
-            query = """
-                SELECT a.attname
-                FROM   pg_index i
-                JOIN   pg_attribute a ON a.attrelid = i.indrelid
-                                      AND a.attnum = ANY(i.indkey)
-                WHERE  i.indrelid = %s::regclass
-                AND    i.indisprimary
-            """
-            cursor.execute(query, (f'{schema}.{table}',))
-            result = cursor.fetchone()
-            
-            if result:
-                primary_key = result[0]
-                cursor.close()
-                return primary_key
-            
-            # If no primary key, get the first column
-            query = """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-                LIMIT 1
-            """
-            cursor.execute(query, (schema, table))
-            result = cursor.fetchone()
-            
-            if result:
-                first_column = result[0]
-                cursor.close()
-                return first_column
+            self._load_table_metadata(schema, table)
             
             # If all else fails, return a default column name that might exist
-            cursor.close()
-            return "id"  # Common default primary key name
+            return self._pk_cache.get(f"{schema}.{table}", "id")
             
         except Exception as e:
             logger.error(f"Error getting primary key for table {table_name}: {e}")
             return "id"  # Fallback to a common primary key name
     
-    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None) -> Dict[str, Any]:
-        """Get paginated records from a specific table, optionally with specific columns"""
+    def _validate_table_exists(self, table_name: str) -> bool:
+        """Validate that a table exists to prevent SQL injection"""
+        # Handle schema.table format
+        schema = 'public'
+        table = table_name
+        if '.' in table_name:
+            schema, table = table_name.split('.')
+        
+        if not self._load_table_metadata(schema, table):
+            logger.error(f"Table '{table_name}' not found")
+            raise ValueError(f"Table '{table_name}' not found")
+        
+        return True
+    
+    def _validate_columns(self, table_name: str, columns: List[str]) -> List[str]:
+        """Validate that columns exist in the table"""
+        # Handle schema.table format
+        schema = 'public'
+        table = table_name
+        if '.' in table_name:
+            schema, table = table_name.split('.')
+        
+        known = set(self._load_table_metadata(schema, table))
+        if any(col not in known for col in columns):
+            # Reload once in case columns were added since the metadata was cached
+            self.invalidate_metadata(f"{schema}.{table}")
+            known = set(self._load_table_metadata(schema, table))
+        return [col for col in columns if col in known]
+    
+    def _column_type(self, table_name: str, column: str) -> str:
+        """Get the catalog type name of a column, reloading the metadata once if it is unknown"""
+        # Handle schema.table format
+        schema = 'public'
+        table = table_name
+        if '.' in table_name:
+            schema, table = table_name.split('.')
+        
+        key = f"{schema}.{table}"
+        self._load_table_metadata(schema, table)
+        column_type = self._types_cache.get(key, {}).get(column)
+        if column_type is None:
+            # Reload once in case the column was added or retyped since the metadata was cached
+            self.invalidate_metadata(key)
+            self._load_table_metadata(schema, table)
+            column_type = self._types_cache.get(key, {}).get(column)
+        if column_type is None:
+            raise ValueError(f"Column '{column}' not found in table '{table_name}'")
+        return column_type
+    
+    def get_paginated_records(self, table_name: str, page: int = 1, page_size: int = 50, columns: List[str] = None,
+                              exact_count: bool = False, after_id: Any = None) -> Dict[str, Any]:
+        """Get paginated records from a specific table, optionally with specific columns
+
+        total_count is the planner's row estimate for large tables unless exact_count is set.
+        Pass the previous page's next_cursor as after_id to seek past it on the primary key;
+        page numbers use OFFSET, which reads and discards every earlier row.
+        """
         try:
             if not self.conn:
                 logger.error("No active connection")
                 return {"records": [], "total_count": 0, "total_pages": 0}
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            table_identifier = self._qualify(table_name)
             
             # Validate table exists
             self._validate_table_exists(table_name)
             
             # Get total count for pagination info
-            cursor = self.conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_identifier}")
-            total_count = cursor.fetchone()[0]
+            total_count = self._count_records(table_name, table_identifier, exact_count)
             
             # Calculate pagination values
             total_pages = math.ceil(total_count / page_size)
             offset = (page - 1) * page_size
             
+            # Pages are ordered by the key so page numbers and cursors walk the same order
+            primary_key = self._get_primary_key_or_first_column(table_name)
+            
             # If columns are specified, validate them and use only valid ones
+            key_alias = None
             if columns:
                 valid_columns = self._validate_columns(table_name, columns)
-                columns_sql = ", ".join([f'"{col}"' for col in valid_columns]) if valid_columns else "*"
+                selected = list(map(sql.Identifier, valid_columns))
+                # The key is read under an alias for the next cursor and dropped from the records
+                if valid_columns and primary_key not in valid_columns:
+                    key_alias = _KEY_ALIAS
+                    selected.append(sql.SQL("{} AS {}").format(sql.Identifier(primary_key), sql.Identifier(key_alias)))
+                columns_sql = sql.SQL(", ").join(selected) if selected else sql.SQL("*")
             else:
-                columns_sql = "*"
+                columns_sql = sql.SQL("*")
             
             # Get paginated records
-            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            query = f"SELECT {columns_sql} FROM {table_identifier} LIMIT %s OFFSET %s"
-            cursor.execute(query, (page_size, offset))
-            
-            records = cursor.fetchall()
+            with self._cursor(dict_cursor=True) as cursor:
+                if after_id is not None:
+                    # Keyset page: an index seek past the last key, however deep the page
+                    query = sql.SQL("SELECT {cols} FROM {tbl} WHERE {pk} > %s ORDER BY {pk} LIMIT %s").format(
+                        cols=columns_sql, tbl=table_identifier, pk=sql.Identifier(primary_key))
+                    cursor.execute(query, (after_id, page_size))
+                else:
+                    query = sql.SQL("SELECT {cols} FROM {tbl} ORDER BY {pk} LIMIT %s OFFSET %s").format(
+                        cols=columns_sql, tbl=table_identifier, pk=sql.Identifier(primary_key))
+                    cursor.execute(query, (page_size, offset))
+                records = cursor.fetchall()
             # Convert records to dicts
             records = [dict(record) for record in records]
-            cursor.close()
+            if key_alias:
+                keys = [record.pop(key_alias) for record in records]
+            else:
+                keys = [record.get(primary_key) for record in records]
+            next_cursor = keys[-1] if len(records) == page_size else None
             
             logger.info(f"Retrieved {len(records)} records from table {table_name} (page {page}, page_size {page_size})")
             
             return {
                 "records": records,
                 "total_count": total_count,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": next_cursor
             }
         except Exception as e:
             logger.error(f"Error getting paginated records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return {"records": [], "total_count": 0, "total_pages": 0}
     
+    def iter_paginated_records(self, table_name: str, page_size: int = 1000, columns: List[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream every record of a table through a server-side cursor, page_size rows per round-trip"""
+        if not self.conn:
+            logger.error("No active connection")
+            return
+        
+        table_identifier = self._qualify(table_name)
+        
+        # Validate table exists
+        self._validate_table_exists(table_name)
+        
+        if columns:
+            valid_columns = self._validate_columns(table_name, columns)
+            columns_sql = sql.SQL(", ").join(map(sql.Identifier, valid_columns)) if valid_columns else sql.SQL("*")
+        else:
+            columns_sql = sql.SQL("*")
+        
+        # A named cursor keeps the result on the server; the connection's transaction stays open
+        # until the generator is exhausted or closed
+        cursor = self.conn.cursor(name=f"iter_{uuid.uuid4().hex}", cursor_factory=psycopg2.extras.RealDictCursor)
+        cursor.itersize = max(1, page_size)
+        try:
+            cursor.execute(sql.SQL("SELECT {} FROM {}").format(columns_sql, table_identifier))
+            for record in cursor:
+                yield dict(record)
+        finally:
+            cursor.close()
+            # End the read transaction that held the server-side cursor
+            self.conn.rollback()
+    
     def get_table_records(self, table_name: str, page: int = 1, page_size: int = 50) -> List[Dict[str, Any]]:
         """Get table records - wrapper for get_paginated_records"""
         try:
@@ -284,6 +549,37 @@ class PostgreSQLConnection:
             logger.error(f"Error getting table records with columns: {e}")
             return []
     
+    def _insert_returning(self, table_name: str, data: Dict[str, Any], returning: sql.Composable, dict_cursor: bool = False) -> Any:
+        """Insert one record and fetch the RETURNING row, committing on success"""
+        table_identifier = self._qualify(table_name)
+        
+        # Validate table exists
+        self._validate_table_exists(table_name)
+        
+        # Validate columns exist
+        valid_columns = self._validate_columns(table_name, list(data.keys()))
+        if not valid_columns:
+            raise ValueError("No valid columns provided")
+        
+        # Filter data to only include valid columns
+        filtered_data = {col: data[col] for col in valid_columns if col in data}
+        
+        # Prepare INSERT statement
+        columns = list(filtered_data.keys())
+        placeholders = sql.SQL(", ").join(sql.Placeholder() * len(columns))
+        column_names = sql.SQL(", ").join(map(sql.Identifier, columns))
+        
+        query = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING {}").format(
+            table_identifier, column_names, placeholders, returning)
+        values = list(filtered_data.values())
+        
+        with self._cursor(dict_cursor=dict_cursor) as cursor:
+            cursor.execute(query, values)
+            # Get the inserted record
+            record = cursor.fetchone()
+        self.conn.commit()
+        return record
+    
     def create_record(self, table_name: str, data: Dict[str, Any]) -> Optional[str]:
         """Insert a new record into the table"""
         try:
@@ -291,49 +587,80 @@ class PostgreSQLConnection:
                 logger.error("No active connection")
                 return None
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            # Only the key comes back, not the whole (possibly wide) row
+            primary_key = self._get_primary_key_or_first_column(table_name)
+            record = self._insert_returning(table_name, data, sql.Identifier(primary_key))
             
-            # Validate table exists
-            self._validate_table_exists(table_name)
+            record_id = str(record[0]) if record else None
             
-            # Validate columns exist
-            valid_columns = self._validate_columns(table_name, list(data.keys()))
-            if not valid_columns:
-                raise ValueError("No valid columns provided")
+            logger.info(f"Successfully created record with ID {record_id} in table {table_name}")
+            return record_id
             
-            # Filter data to only include valid columns
-            filtered_data = {col: data[col] for col in valid_columns if col in data}
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error(f"Error creating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            raise e
+    
+    def create_record_full(self, table_name: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Insert a new record and return the stored row, including defaults and trigger changes"""
+        try:
+            if not self.conn:
+                logger.error("No active connection")
+                return None
             
-            cursor = self.conn.cursor()
+            record = self._insert_returning(table_name, data, sql.SQL("*"), dict_cursor=True)
             
-            # Prepare INSERT statement
-            columns = list(filtered_data.keys())
-            placeholders = ", ".join(["%s"] * len(columns))
-            column_names = ", ".join([f'"{col}"' for col in columns])
+            logger.info(f"Successfully created record in table {table_name}")
+            return dict(record) if record else None
             
-            query = f"INSERT INTO {table_identifier} ({column_names}) VALUES ({placeholders}) RETURNING *"
-            values = list(filtered_data.values())
+        except Exception as e:
+            if self.conn:
+                self.conn.rollback()
+            logger.error(f"Error creating record in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
+            raise e
+    
+    def bulk_create_records(self, table_name: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert multiple records with multi-row INSERT statements in one transaction; returns the new IDs"""
+        try:
+            if not self.conn or not rows:
+                return []
             
-            cursor.execute(query, values)
-            self.conn.commit()
+            table_identifier = self._qualify(table_name)
             
-            # Get the inserted record
-            record = cursor.fetchone()
-            record_id = str(record[0]) if record else None
-            cursor.close()
+            # Validate table exists
+            self._validate_table_exists(table_name)
             
-            logger.info(f"Successfully created record with ID {record_id} in table {table_name}")
-            return record_id
+            # Validate the union of all row keys once; a row missing a column inserts NULL for it
+            requested = list(dict.fromkeys(key for row in rows for key in row))
+            columns = self._validate_columns(table_name, requested)
+            if not columns:
+                raise ValueError("No valid columns provided")
+            
+            primary_key = self._get_primary_key_or_first_column(table_name)
+            column_names = sql.SQL(", ").join(map(sql.Identifier, columns))
+            query = sql.SQL("INSERT INTO {} ({}) VALUES %s RETURNING {}").format(
+                table_identifier, column_names, sql.Identifier(primary_key))
+            
+            # execute_values expands VALUES %s into INSERT_PAGE_SIZE rows per statement
+            with self._cursor() as cursor:
+                returned = psycopg2.extras.execute_values(
+                    cursor, query, [tuple(row.get(col) for col in columns) for row in rows],
+                    page_size=INSERT_PAGE_SIZE, fetch=True
+                )
+            self.conn.commit()
+            
+            record_ids = [str(row[0]) for row in returned]
+            logger.info(f"Bulk created {len(record_ids)} records in table {table_name}")
+            return record_ids
             
         except Exception as e:
             if self.conn:
                 self.conn.rollback()
-            logger.error(f"Error creating record in table {table_name}: {e}")
+            logger.error(f"Error bulk creating records in table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def delete_record(self, table_name: str, record_id: str) -> bool:
@@ -343,12 +670,7 @@ class PostgreSQLConnection:
                 logger.error("No active connection")
                 return False
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            table_identifier = self._qualify(table_name)
             
             # Validate table exists
             self._validate_table_exists(table_name)
@@ -356,14 +678,12 @@ class PostgreSQLConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            query = f'DELETE FROM {table_identifier} WHERE "{primary_key}" = %s'
-            cursor.execute(query, (record_id,))
+            query = sql.SQL("DELETE FROM {} WHERE {} = %s").format(table_identifier, sql.Identifier(primary_key))
+            with self._cursor() as cursor:
+                cursor.execute(query, (record_id,))
+                rows_affected = cursor.rowcount
             self.conn.commit()
             
-            rows_affected = cursor.rowcount
-            cursor.close()
-            
             if rows_affected > 0:
                 logger.info(f"Successfully deleted record {record_id} from table {table_name}")
                 return True
@@ -375,6 +695,7 @@ class PostgreSQLConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error deleting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             raise e
     
     def bulk_delete_records(self, table_name: str, record_ids: List[str]) -> int:
@@ -383,12 +704,7 @@ class PostgreSQLConnection:
             if not self.conn or not record_ids:
                 return 0
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            table_identifier = self._qualify(table_name)
             
             # Validate table exists
             self._validate_table_exists(table_name)
@@ -396,18 +712,19 @@ class PostgreSQLConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor()
-            
-            # Create placeholders for IN clause
-            placeholders = ", ".join(["%s"] * len(record_ids))
-            delete_query = f'DELETE FROM {table_identifier} WHERE "{primary_key}" IN ({placeholders})'
-            
-            cursor.execute(delete_query, record_ids)
+            # One array parameter keeps the statement text the same for any number of IDs;
+            # the array is cast to the key's type since the IDs arrive as strings
+            key_type = self._column_type(table_name, primary_key)
+            # The type name comes from the catalog (format_type quotes it where needed); it keeps the
+            # typmod, so char(n)/bit(n) keys are not cast to char(1)/bit(1) and truncated
+            delete_query = sql.SQL("DELETE FROM {} WHERE {} = ANY(%s::{}[])").format(
+                table_identifier, sql.Identifier(primary_key), sql.SQL(key_type))
+            
+            with self._cursor() as cursor:
+                cursor.execute(delete_query, (list(record_ids),))
+                deleted_count = cursor.rowcount
             self.conn.commit()
             
-            deleted_count = cursor.rowcount
-            cursor.close()
-            
             logger.info(f"Bulk deleted {deleted_count} records from table {table_name}")
             return deleted_count
             
@@ -415,6 +732,7 @@ class PostgreSQLConnection:
             if self.conn:
                 self.conn.rollback()
             logger.error(f"Error bulk deleting records from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return 0
     
     def get_record_by_id(self, table_name: str, record_id: str) -> Optional[Dict[str, Any]]:
@@ -424,12 +742,7 @@ class PostgreSQLConnection:
                 logger.error("No active connection")
                 return None
             
-            # Handle schema.table format
-            if '.' in table_name:
-                schema, table = table_name.split('.')
-                table_identifier = f'"{schema}"."{table}"'
-            else:
-                table_identifier = f'"{table_name}"'
+            table_identifier = self._qualify(table_name)
             
             # Validate table exists
             self._validate_table_exists(table_name)
@@ -437,22 +750,52 @@ class PostgreSQLConnection:
             # Get primary key column
             primary_key = self._get_primary_key_or_first_column(table_name)
             
-            cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            query = f'SELECT * FROM {table_identifier} WHERE "{primary_key}" = %s'
-            cursor.execute(query, (record_id,))
-            
-            record = cursor.fetchone()
-            cursor.close()
+            query = sql.SQL("SELECT * FROM {} WHERE {} = %s").format(table_identifier, sql.Identifier(primary_key))
+            with self._cursor(dict_cursor=True) as cursor:
+                cursor.execute(query, (record_id,))
+                record = cursor.fetchone()
             
             return dict(record) if record else None
             
         except Exception as e:
             logger.error(f"Error getting record from table {table_name}: {e}")
+            self._check_metadata_error(table_name, e)
             return None
     
     def close(self):
-        """Close the connection"""
+        """Close the connection (pooled connections are returned to their pool)"""
         if self.conn:
-            self.conn.close()
+            self.invalidate_metadata()
+            self._ident_cache.clear()
+            if self._pool is not None:
+                # Broken connections are discarded instead of being handed out again
+                self._pool.putconn(self.conn, close=bool(self.conn.closed))
+                self._pool = None
+            else:
+                self.conn.close()
             logger.info("PostgreSQL connection closed")
-            self.conn = None
\ No newline at end of file
+            self.conn = None
+
+
+# PostgreSQLConnection methods exposed as coroutines by AsyncPostgreSQLConnection
+_ASYNC_METHODS = (
+    "get_all_tables",
+    "get_all_tables_with_metadata",
+    "get_table_record_count",
+    "get_first_10_records",
+    "get_table_columns",
+    "get_paginated_records",
+    "get_table_records",
+    "get_table_records_with_columns",
+    "create_record",
+    "create_record_full",
+    "bulk_create_records",
+    "delete_record",
+    "bulk_delete_records",
+    "get_record_by_id",
+)
+
+class AsyncPostgreSQLConnection(AsyncConnector):
+    """Asyncio facade over PostgreSQLConnection that runs each call on a worker thread"""
+    def __init__(self):
+        super().__init__(PostgreSQLConnection, POOL_MAX, "PostgreSQL", _ASYNC_METHODS)
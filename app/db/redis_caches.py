@@ -367,4 +367,19 @@ def cache_table_preview(session_id: str, table_name: str, preview_data: List[Dic
 def get_cached_table_preview(session_id: str, table_name: str) -> Optional[List[Dict[str, Any]]]:
     """Get cached table preview"""
     key = f"{session_id}:table:{table_name}:preview"
-    return get_cache(key)
\ No newline at end of file
+    return get_cache(key)
+
+def cache_collection_count(server: str, db_name: str, table_name: str, count: int, expire: int = 60) -> bool:
+    """Cache a MongoDB collection document count (1 min expiry, shared across sessions of one server:port)"""
+    key = f"mongo:{server}:{db_name}:{table_name}:count"
+    return set_cache(key, count, expire)
+
+def get_cached_collection_count(server: str, db_name: str, table_name: str) -> Optional[int]:
+    """Get cached MongoDB collection document count"""
+    key = f"mongo:{server}:{db_name}:{table_name}:count"
+    return get_cache(key)
+
+def invalidate_collection_count(server: str, db_name: str, table_name: str) -> bool:
+    """Invalidate cached MongoDB collection document count"""
+    key = f"mongo:{server}:{db_name}:{table_name}:count"
+    return delete_cache(key)
@@ -27,6 +27,12 @@ static_dir = os.path.join(BASE_DIR, "static")
 async def lifespan(app: FastAPI):
     # Startup: nothing special needed
     yield
+    # Shutdown: drain cached database connections
+    try:
+        from .db.database import close_all_connections
+        close_all_connections()
+    except Exception as e:
+        logger.error(f"Error closing database connections: {e}")
     # Shutdown: close Redis connection
     try:
         from .db.redis_caches import close
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import List, Dict, Any, Optional
 import logging
 import math
@@ -132,7 +132,21 @@ async def get_table_records(
         return {**cached_data, "table": table_name, "page": page, "page_size": page_size}
     
     with get_db_connection(session_id) as db:
-        result = db.get_paginated_records(table_name, page, page_size)
+        if hasattr(db, 'get_paginated_records_raw'):
+            # Connector encodes the page itself; skip response-model re-serialization
+            body = db.get_paginated_records_raw(table_name, page, page_size,
+                                                extra={"table": table_name, "page": page, "page_size": page_size})
+            if body is None:
+                # The page could not be read or encoded; answer empty without caching it
+                return {"table": table_name, "page": page, "page_size": page_size,
+                        "total_count": 0, "total_pages": 0, "records": []}
+        else:
+            body = None
+            result = db.get_paginated_records(table_name, page, page_size)
+    
+    if body is not None:
+        cache_table_records(session_id, table_name, page, page_size, body.decode())
+        return Response(content=body, media_type="application/json")
         
     result["table"] = table_name
     result["page"] = page